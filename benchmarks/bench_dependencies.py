@@ -0,0 +1,62 @@
+"""
+Dependency resolution cost: the old per-call ``inspect.signature``
+recursion of ``Depends.__call__`` against the precompiled ``DependencyPlan``.
+
+    $ python -m benchmarks.bench_dependencies
+"""
+import timeit
+
+from flask import Flask
+
+from flask_ease import Depends, Security, OAuth2PasswordBearer
+from flask_ease.utils import DependencyPlan, extract_dependencies
+
+oauth2_scheme = OAuth2PasswordBearer("/login")
+
+
+def legacy_resolve(marker):
+    if isinstance(marker, Security):
+        return marker()
+    kwargs_to_pass = {}
+    for k, dep in extract_dependencies(marker.dependency).items():
+        kwargs_to_pass[k] = legacy_resolve(dep)
+    return marker.dependency(**kwargs_to_pass)
+
+
+def get_current_user(token=Security(oauth2_scheme)):
+    return {"token": token}
+
+
+def make_chain(depth):
+    dependency = get_current_user
+    for level in range(depth - 1):
+        def dependency(parent=Depends(dependency)):
+            return parent
+    return {"current_user": Depends(dependency)}
+
+
+def main(number=20000):
+    app = Flask(__name__)
+    with app.test_request_context(headers={"Authorization": "Bearer abc"}):
+        print(f"{'depth':>5} {'legacy (us)':>12} {'plan (us)':>10} {'speedup':>8}")
+        for depth in (1, 3, 5):
+            dependencies = make_chain(depth)
+            plan = DependencyPlan(dependencies)
+
+            def legacy():
+                return {k: legacy_resolve(v) for k, v in dependencies.items()}
+
+            assert legacy() == plan.resolve()
+            legacy_time = min(timeit.repeat(legacy, number=number, repeat=3))
+            plan_time = min(
+                timeit.repeat(plan.resolve, number=number, repeat=3)
+            )
+            print(
+                f"{depth:>5} {legacy_time / number * 1e6:>12.2f} "
+                f"{plan_time / number * 1e6:>10.2f} "
+                f"{legacy_time / plan_time:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
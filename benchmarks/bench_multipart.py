@@ -0,0 +1,115 @@
+"""
+Multipart extraction cost for a form with 50 files across 10 fields: the
+old scan of ``files_dict.lists()`` per field against the indexed
+extractor compiled by ``compile_body_binder``.
+
+    $ python -m benchmarks.bench_multipart
+"""
+import timeit
+from io import BytesIO
+from typing import List
+
+from pydantic import BaseModel, create_model
+
+from flask_ease import FlaskEaseAPI, File, MultipartForm
+from flask_ease.utils import compile_body_binder, extract_params
+
+FIELDS = 10
+FILES_PER_FIELD = 5
+
+Album = create_model(
+    "Album",
+    __base__=BaseModel,
+    **{f"field_{n}": (List[File], ...) for n in range(FIELDS)}
+)
+
+
+def legacy_extract_files(_key, files_dict, FileType):
+    _files = []
+    for element in files_dict.lists():
+        if element[0] == _key:
+            for _file in element[1]:
+                _files.append(
+                    FileType(mime_type=element[1][0].mimetype, _data=_file)
+                )
+    if len(_files) == 1:
+        return _files[0]
+    return _files
+
+
+def make_form():
+    return {
+        f"field_{n}": [
+            (BytesIO(b"x" * 64), f"{n}-{i}.png", "image/png")
+            for i in range(FILES_PER_FIELD)
+        ]
+        for n in range(FIELDS)
+    }
+
+
+def main(number=2000):
+    def upload(album: MultipartForm(schema=Album)):
+        return {}
+
+    _, validations = extract_params("/albums", upload)
+    properties = validations["request_form"]["album"]["properties"]
+    (bind,) = compile_body_binder(validations)
+
+    api = FlaskEaseAPI()
+    with api.app.test_request_context(
+        "/albums",
+        method="POST",
+        data=make_form(),
+        content_type="multipart/form-data"
+    ) as ctx:
+        files = ctx.request.files
+        ctx.request.form
+
+        def legacy_lookup():
+            return {
+                k: legacy_extract_files(k, files, v["schema"])
+                for k, v in properties.items()
+            }
+
+        def indexed_lookup():
+            return {
+                k: [
+                    v["schema"](mime_type=part.mimetype, _data=part)
+                    for part in files.getlist(k)
+                ]
+                for k, v in properties.items()
+            }
+
+        def legacy():
+            return Album(**legacy_lookup())
+
+        def indexed():
+            kwargs_to_pass = {}
+            bind(kwargs_to_pass)
+            return kwargs_to_pass["album"]
+
+        assert legacy() == indexed()
+        results = [
+            (
+                name,
+                min(timeit.repeat(old, number=number, repeat=3)),
+                min(timeit.repeat(new, number=number, repeat=3))
+            )
+            for name, old, new in (
+                ("file lookup", legacy_lookup, indexed_lookup),
+                ("full bind", legacy, indexed)
+            )
+        ]
+
+    print(f"{FIELDS} fields x {FILES_PER_FIELD} files, us per call")
+    print(f"{'':<12} {'legacy':>8} {'indexed':>8} {'speedup':>8}")
+    for name, legacy_time, indexed_time in results:
+        print(
+            f"{name:<12} {legacy_time / number * 1e6:>8.1f} "
+            f"{indexed_time / number * 1e6:>8.1f} "
+            f"{legacy_time / indexed_time:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
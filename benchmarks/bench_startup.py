@@ -0,0 +1,180 @@
+"""
+Startup cost of registering routes, each with its own request and response
+model, across blueprints that are then extended into one app. Time per
+route should stay flat as the route count grows. The docs columns isolate,
+for a single app, the old ``{**a, **b}`` rebuilding of the docs registries,
+which is quadratic, against in-place merging.
+
+    $ python -m benchmarks.bench_startup
+"""
+import gc
+import time
+
+from pydantic import BaseModel, create_model
+
+from flask_ease import FlaskEaseAPI
+from flask_ease.utils import extract_params, parse_response_model
+
+BLUEPRINTS = 20
+
+
+class LegacyFlaskEaseAPI(FlaskEaseAPI):
+    def _add_docs(
+        self,
+        route,
+        methods,
+        func,
+        tags,
+        auth_required,
+        doc_details,
+        docs_responses,
+        docs_definitions,
+        docs_components={}
+    ):
+        filtered_req_body = {
+            k: v
+            for k, v in doc_details["request_body"]["content"].items()
+            if v
+        }
+        endpoint_doc_details = {
+            "description": func.__doc__.strip() if func.__doc__ else "",
+            "parameters": doc_details["params"],
+            "tags": tags,
+            "requestBody": {
+                "content": filtered_req_body
+            },
+            "endpoint_method": func.__name__,
+            "responses": docs_responses,
+            "auth_required": auth_required
+        }
+        if route in self.endpoints.keys():
+            self.endpoints[route][methods[0].lower()] = endpoint_doc_details
+        else:
+            self.endpoints[route] = {
+                methods[0].lower(): endpoint_doc_details
+            }
+        if "schemas" in doc_details["components"].keys():
+            self.components = {
+                **self.components,
+                **doc_details["components"]["schemas"]
+            }
+        self.components = {**self.components, **docs_components}
+        self.definitions = {
+            **self.definitions,
+            **docs_definitions,
+            **doc_details["definitions"]
+        }
+
+    def extend(self, blueprints):
+        for blueprint in blueprints:
+            self.app.register_blueprint(blueprint.app)
+            self.endpoints = {**self.endpoints, **blueprint.endpoints}
+            self.components = {**self.components, **blueprint.components}
+            self.definitions = {**self.definitions, **blueprint.definitions}
+
+
+def make_models(routes):
+    models = []
+    for n in range(routes):
+        tag = create_model(f"Tag{n}", __base__=BaseModel, name=(str, ...))
+        models.append((
+            create_model(f"PetIn{n}", __base__=BaseModel, tag=(tag, ...)),
+            create_model(f"PetOut{n}", __base__=BaseModel, id=(int, ...))
+        ))
+    return models
+
+
+def register(api_class, models):
+    api = api_class(title="Startup")
+    per_blueprint = len(models) // BLUEPRINTS
+    blueprints = []
+    for index in range(BLUEPRINTS):
+        blueprint = api_class(
+            blueprint_name=f"pets_{index}",
+            url_prefix=f"/pets_{index}"
+        )
+        for n in range(index * per_blueprint, (index + 1) * per_blueprint):
+            body, response = models[n]
+
+            def create_pet(pet_id: int, pet: body):
+                return {}
+            create_pet.__name__ = f"create_pet_{n}"
+            blueprint.post(
+                f"/{n}/<int:pet_id>",
+                response_model=response
+            )(create_pet)
+        blueprints.append(blueprint)
+    api.extend(blueprints)
+    return api
+
+
+def make_docs(models):
+    # * what _register hands to _add_docs, computed once up front
+    docs = []
+    for n, (body, response) in enumerate(models):
+        def create_pet(pet_id: int, pet: body):
+            return {}
+        create_pet.__name__ = f"create_pet_{n}"
+        route = f"/pets/{n}/<int:pet_id>"
+        doc_details, _ = extract_params(route, create_pet)
+        docs_responses, docs_definitions, _, docs_components = \
+            parse_response_model(response, {})
+        docs.append((
+            route,
+            ["POST"],
+            create_pet,
+            [],
+            False,
+            doc_details,
+            docs_responses,
+            docs_definitions,
+            docs_components
+        ))
+    return docs
+
+
+def merge_docs(api_class, docs):
+    # * every route on one app, where the registries grow the largest
+    api = api_class(title="Startup")
+    for details in docs:
+        api._add_docs(*details)
+    return api
+
+
+def timed(register, api_class, payload):
+    # * like timeit, keep collections of the growing heap out of the timing
+    gc.collect()
+    gc.disable()
+    try:
+        started = time.perf_counter()
+        api = register(api_class, payload)
+        return time.perf_counter() - started, api
+    finally:
+        gc.enable()
+
+
+def main():
+    print(
+        f"{'routes':>6} {'register (ms)':>14} {'us/route':>9} "
+        f"{'legacy docs (ms)':>17} {'in place docs (ms)':>19}"
+    )
+    for routes in (500, 1000, 2000, 4000, 8000):
+        models = make_models(routes)
+        # * warm pydantic's schema cache so every run sees the same work
+        register(FlaskEaseAPI, models)
+        register_time, _ = timed(register, FlaskEaseAPI, models)
+
+        docs = make_docs(models)
+        legacy_time, legacy_api = timed(merge_docs, LegacyFlaskEaseAPI, docs)
+        in_place_time, api = timed(merge_docs, FlaskEaseAPI, docs)
+        assert legacy_api.components.keys() == api.components.keys()
+        assert legacy_api.endpoints.keys() == api.endpoints.keys()
+        print(
+            f"{routes:>6} {register_time * 1e3:>14.1f} "
+            f"{register_time / routes * 1e6:>9.1f} "
+            f"{legacy_time * 1e3:>17.2f} {in_place_time * 1e3:>19.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
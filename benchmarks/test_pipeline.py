@@ -0,0 +1,169 @@
+"""
+Request pipeline micro-benchmarks, driven through the Werkzeug test client
+with example-style routes. Needs pytest-benchmark; results are stored as
+JSON under benchmarks/results so releases can be compared:
+
+    $ python -m pytest benchmarks --benchmark-autosave \
+        --benchmark-storage=benchmarks/results
+    $ python -m pytest benchmarks --benchmark-compare \
+        --benchmark-storage=benchmarks/results
+"""
+from io import BytesIO
+from typing import List
+
+import pytest
+from pydantic import BaseModel
+
+from flask_ease import (
+    FlaskEaseAPI,
+    Depends,
+    File,
+    MultipartForm,
+    OAuth2PasswordRequestForm
+)
+
+
+class PetCreate(BaseModel):
+    name: str
+    kind: str
+    age: int
+    tags: List[str] = []
+
+
+class PetInResp(PetCreate):
+    id: int
+
+
+class PetsInResp(BaseModel):
+    pets: List[PetInResp]
+
+
+class PetPhotos(BaseModel):
+    title: str
+    photos: List[File]
+
+
+def make_chain(depth):
+    def dependency():
+        return 0
+    for level in range(depth - 1):
+        def dependency(parent=Depends(dependency)):
+            return parent + 1
+    return dependency
+
+
+def make_api(page_sizes=(10, 1000, 10000), depths=(1, 3, 5)):
+    api = FlaskEaseAPI(title="Benchmarks")
+
+    @api.get("/pets/<int:pet_id>", response_model=PetInResp)
+    def read_pet(pet_id: int, kind: str = "dog", limit: int = 10):
+        return {"id": pet_id, "name": "rex", "kind": kind, "age": limit}
+
+    @api.post("/pets", response_model=PetInResp)
+    def create_pet(pet: PetCreate):
+        return {"id": 1, **pet.dict()}
+
+    @api.post("/login")
+    def login(form_data: OAuth2PasswordRequestForm):
+        return {"access_token": form_data.username}
+
+    @api.post("/photos")
+    def upload_photos(obj_in: MultipartForm(schema=PetPhotos)):
+        return {"count": len(obj_in.photos)}
+
+    for size in page_sizes:
+        pets = [
+            {"id": n, "name": f"pet-{n}", "kind": "cat", "age": n % 20}
+            for n in range(size)
+        ]
+
+        def list_pets(pets=pets):
+            return {"pets": pets}
+        list_pets.__name__ = f"list_pets_{size}"
+        api.get(f"/pets/page/{size}", response_model=PetsInResp)(list_pets)
+
+    for depth in depths:
+        chain = make_chain(depth)
+
+        def read_depth(value=Depends(chain)):
+            return {"value": value}
+        read_depth.__name__ = f"read_depth_{depth}"
+        api.get(f"/depends/{depth}")(read_depth)
+
+    return api
+
+
+@pytest.fixture(scope="module")
+def client():
+    return make_api().app.test_client()
+
+
+def test_path_and_query_binding(benchmark, client):
+    resp = benchmark(client.get, "/pets/1?kind=cat&limit=3")
+    assert resp.status_code == 200
+
+
+def test_json_body_validation(benchmark, client):
+    pet = {"name": "rex", "kind": "dog", "age": 3, "tags": ["a", "b"]}
+    resp = benchmark(client.post, "/pets", json=pet)
+    assert resp.status_code == 200
+
+
+def test_oauth2_password_form(benchmark, client):
+    resp = benchmark(
+        client.post,
+        "/login",
+        data={"username": "user", "password": "secret"}
+    )
+    assert resp.get_json() == {"access_token": "user"}
+
+
+def test_multipart_form(benchmark, client):
+    def upload():
+        return client.post(
+            "/photos",
+            data={
+                "title": "album",
+                "photos": [
+                    (BytesIO(b"x" * 1024), f"{n}.png", "image/png")
+                    for n in range(5)
+                ]
+            },
+            content_type="multipart/form-data"
+        )
+    resp = benchmark(upload)
+    assert resp.get_json() == {"count": 5}
+
+
+@pytest.mark.parametrize("depth", [1, 3, 5])
+def test_depends_chain(benchmark, client, depth):
+    resp = benchmark(client.get, f"/depends/{depth}")
+    assert resp.get_json() == {"value": depth - 1}
+
+
+@pytest.mark.parametrize("size", [10, 1000, 10000])
+def test_response_model_validation(benchmark, client, size):
+    resp = benchmark(client.get, f"/pets/page/{size}")
+    assert len(resp.get_json()["pets"]) == size
+
+
+@pytest.mark.parametrize("routes", [10, 100, 1000])
+def test_openapi_generate(benchmark, routes):
+    def setup():
+        api = FlaskEaseAPI(title="Generate")
+        for n in range(routes):
+            def read_pet(pet_id: int, kind: str = "dog"):
+                return {}
+            read_pet.__name__ = f"read_pet_{n}"
+            api.get(
+                f"/pets_{n}/<int:pet_id>",
+                response_model=PetInResp,
+                tags=["pets"]
+            )(read_pet)
+        return (api,), {}
+
+    benchmark.pedantic(
+        lambda api: api.generate(),
+        setup=setup,
+        rounds=5 if routes == 1000 else 20
+    )
@@ -9,7 +9,8 @@ from flask_ease import (
     MultipartForm,
     File,
     status,
-    Form
+    Form,
+    Stream
 )
 from flask_cors import CORS
 import os
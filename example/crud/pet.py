@@ -11,6 +11,12 @@ def get_all_pets_in_db(
     return pets
 
 
+def iter_all_pets_in_db():
+    query = Pet.select().execution_options(stream_results=True)
+    for pet in db.engine.execute(query):
+        yield dict(pet)
+
+
 def get_all_pets_count_in_db():
     query = Pet.count()
     count = db.session.execute(query).scalar()
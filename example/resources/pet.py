@@ -3,7 +3,8 @@ from application import (
     Depends,
     HTTPException,
     status,
-    File
+    File,
+    Stream
 )
 from schemas.pet import (
     PetCreationForm,
@@ -16,9 +17,11 @@ from crud.pet import (
     add_new_pet_to_db,
     find_pet_by_id,
     get_all_pets_count_in_db,
-    get_all_pets_in_db
+    get_all_pets_in_db,
+    iter_all_pets_in_db
 )
 from uuid import uuid4, UUID
+import shutil
 from flask import send_from_directory
 
 pets_blp = FlaskEaseAPI(
@@ -95,6 +98,21 @@ def get_all_pets(
     )
 
 
+@pets_blp.get(
+    route="/export",
+    response_model=Stream[PetInResp],
+    tags=["pets"],
+    auth_required=True
+)
+def export_all_pets(
+    current_user=Depends(get_current_user)
+):
+    """
+    Stream all pets in db as NDJSON
+    """
+    return iter_all_pets_in_db()
+
+
 @pets_blp.post(
     route="/<uuid:id>/photo",
     tags=["pets"],
@@ -105,12 +123,12 @@ def get_all_pets(
 )
 def add_pet_photo(
     id: UUID,
-    photo: File("image/png"),
+    photo: File("image/png", max_length=10 * 1024 * 1024, spooled=True),
     current_user=Depends(get_current_user)
 ):
     """
     Add pet photo.
     """
     with open(f"{id}.png", "wb") as photoFile:
-        photoFile.write(photo)
+        shutil.copyfileobj(photo, photoFile)
     return "True", 204
@@ -1,7 +1,8 @@
 from flask_ease.flask_ease import FlaskEaseAPI
 from flask_ease.schemas import (
     ResponseModel,
-    OAuth2PasswordRequestForm
+    OAuth2PasswordRequestForm,
+    Stream
 )
 from flask_ease.utils import (
     Depends,
@@ -13,5 +14,12 @@ from flask_ease.utils import (
     status
 )
 from flask_ease.auth_schemes import OAuth2PasswordBearer
+from flask_ease.compression import ResponseCompressor
+from flask_ease.profiling import RouteProfiler
+from flask_ease.caching import (
+    ResponseCache,
+    MemoryCacheBackend,
+    RedisCacheBackend
+)
 
 __version__ = '0.2.2'
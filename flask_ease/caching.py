@@ -0,0 +1,148 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+
+from flask import Response
+
+from flask_ease.responses import make_body_response
+
+
+class CachedResponse():
+    # * an already serialized response, as stored by the cache backends;
+    # * variants holds its compressed encodings, if compression is on.
+    def __init__(
+        self,
+        body: bytes,
+        status_code: int,
+        mimetype: str,
+        etag: str = None,
+        variants: dict = None
+    ):
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        self.body = body
+        self.status_code = status_code
+        self.mimetype = mimetype
+        self.etag = etag
+        self.variants = variants
+
+    def make_response(self) -> Response:
+        return make_body_response(
+            self.body,
+            self.status_code,
+            self.mimetype,
+            self.etag,
+            variants=self.variants
+        )
+
+    def to_bytes(self) -> bytes:
+        variants = self.variants
+        header = json.dumps({
+            "status_code": self.status_code,
+            "mimetype": self.mimetype,
+            "etag": self.etag,
+            "lengths": None if variants is None else {
+                encoding: len(data) for encoding, data in variants.items()
+            }
+        }).encode("utf-8")
+        return b"\n".join([header, self.body, *(variants or {}).values()])
+
+    @classmethod
+    def from_bytes(cls, data: bytes):
+        header, _, data = data.partition(b"\n")
+        header = json.loads(header)
+        lengths = header.pop("lengths")
+        if lengths is None:
+            return cls(data, **header)
+
+        # * encoded variants were appended after the body, in order
+        end = len(data)
+        variants = {}
+        for encoding, length in reversed(list(lengths.items())):
+            variants[encoding] = data[end - length:end]
+            end -= length + 1
+        return cls(data[:end], variants=variants, **header)
+
+
+class CacheBackend():
+    def get(self, key: str) -> CachedResponse:
+        raise NotImplementedError
+
+    def set(self, key: str, value: CachedResponse, ttl: int):
+        raise NotImplementedError
+
+
+class MemoryCacheBackend(CacheBackend):
+    # * in-process LRU, entries also expire after their ttl
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> CachedResponse:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: CachedResponse, ttl: int):
+        expires_at = time.monotonic() + ttl if ttl else None
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class RedisCacheBackend(CacheBackend):
+    # * any client with redis-py's get/set(ex=) works, eviction is left to
+    # * the server's maxmemory-policy.
+    def __init__(self, client, prefix: str = "flask_ease:"):
+        self.client = client
+        self.prefix = prefix
+
+    def get(self, key: str) -> CachedResponse:
+        data = self.client.get(self.prefix + key)
+        if data is None:
+            return None
+        return CachedResponse.from_bytes(data)
+
+    def set(self, key: str, value: CachedResponse, ttl: int):
+        self.client.set(self.prefix + key, value.to_bytes(), ex=ttl or None)
+
+
+class ResponseCache():
+    # * keyed on the endpoint, its bound path/query parameters and, when
+    # * given, the value of scope() for the current request.
+    def __init__(
+        self,
+        backend: CacheBackend = None,
+        ttl: int = 60,
+        scope=None
+    ):
+        self.backend = backend if backend is not None \
+            else MemoryCacheBackend()
+        self.ttl = ttl
+        self.scope = scope
+
+    def make_key(self, endpoint: str, params: dict) -> str:
+        key = f"{endpoint}:{sorted(params.items())!r}"
+        if self.scope is not None:
+            key = f"{key}:{self.scope()!r}"
+        return key
+
+    def get(self, key: str) -> CachedResponse:
+        return self.backend.get(key)
+
+    def set(self, key: str, value: CachedResponse):
+        self.backend.set(key, value, self.ttl)
@@ -0,0 +1,91 @@
+import argparse
+import importlib
+import os
+import sys
+
+from flask_ease.compression import (
+    compress_variants,
+    export_levels,
+    file_extensions
+)
+from flask_ease.exceptions import messages
+
+
+def load_api(target: str):
+    module_name, _, attribute = target.partition(":")
+    if not module_name or not attribute:
+        raise ValueError(messages[5].format(target))
+
+    sys.path.insert(0, os.getcwd())
+    module = importlib.import_module(module_name)
+    api = module
+    for name in attribute.split("."):
+        api = getattr(api, name)
+    if callable(api) and not hasattr(api, "build_open_api"):
+        api = api()
+    if not hasattr(api, "build_open_api"):
+        raise ValueError(messages[6].format(target))
+    return api
+
+
+def export_openapi(api, output: str, compress: bool = False) -> list:
+    if api.blueprint_name:
+        raise ValueError(messages[0])
+    if not api.docs:
+        raise ValueError(messages[7])
+    api.build_open_api()
+    payload = api.open_api_payload
+
+    written = [output]
+    with open(output, "wb") as spec_file:
+        spec_file.write(payload.body)
+    if compress:
+        # * compressed once, offline, so the slowest levels pay off
+        variants = compress_variants(payload.body, levels=export_levels)
+        for encoding, data in variants.items():
+            path = output + file_extensions[encoding]
+            with open(path, "wb") as spec_file:
+                spec_file.write(data)
+            written.append(path)
+    return written
+
+
+def main(argv: list = None):
+    parser = argparse.ArgumentParser(prog="flask-ease")
+    commands = parser.add_subparsers(dest="command")
+    commands.required = True
+
+    export = commands.add_parser(
+        "export-openapi",
+        help="write the OpenAPI spec of a FlaskEaseAPI app to disk"
+    )
+    export.add_argument(
+        "target",
+        help="import path of the FlaskEaseAPI instance, as module:api"
+    )
+    export.add_argument(
+        "-o", "--output",
+        default="openapi.json",
+        help="spec file to write (default: openapi.json)"
+    )
+    export.add_argument(
+        "--gzip",
+        action="store_true",
+        help="also write precompressed .gz (and .br/.zst) variants"
+    )
+    args = parser.parse_args(argv)
+
+    # * the spec has to be built even where workers run with docs disabled
+    os.environ["FLASK_EASE_DOCS"] = "1"
+    try:
+        api = load_api(args.target)
+        written = export_openapi(api, args.output, args.gzip)
+    except (ImportError, AttributeError, ValueError) as e:
+        parser.error(str(e))
+
+    for path in written:
+        print(path)
+
+
+if __name__ == "__main__":
+    main()
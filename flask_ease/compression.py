@@ -0,0 +1,124 @@
+import gzip
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+
+def gzip_compress(data: bytes, level: int = 9) -> bytes:
+    return gzip.compress(data, compresslevel=level, mtime=0)
+
+
+def brotli_compress(data: bytes, level: int = 11) -> bytes:
+    return brotli.compress(data, quality=level)
+
+
+def zstd_compress(data: bytes, level: int = 19) -> bytes:
+    return zstandard.ZstdCompressor(level=level).compress(data)
+
+
+encoders = {
+    "gzip": gzip_compress
+}
+if brotli is not None:
+    encoders["br"] = brotli_compress
+if zstandard is not None:
+    encoders["zstd"] = zstd_compress
+
+
+file_extensions = {
+    "gzip": ".gz",
+    "br": ".br",
+    "zstd": ".zst"
+}
+
+# * server preference when the client weighs several encodings the same
+preferred_encodings = ("br", "zstd", "gzip")
+
+# * payloads precompressed in every worker at startup use moderate levels,
+# * most of the ratio for a fraction of the time; the maximum levels are
+# * only worth it for specs exported once by `flask-ease export-openapi`.
+precompress_levels = {
+    "gzip": 6,
+    "br": 5,
+    "zstd": 10
+}
+export_levels = {
+    "gzip": 9,
+    "br": 11,
+    "zstd": 19
+}
+
+
+def compress_variants(
+    data: bytes,
+    precompressed: dict = None,
+    levels: dict = None
+) -> dict:
+    # * every available encoding of data, keyed by content-coding name;
+    # * variants already in precompressed are reused, not recomputed.
+    precompressed = precompressed or {}
+    levels = levels or precompress_levels
+    return {
+        encoding: precompressed[encoding]
+        if encoding in precompressed else encode(data, levels[encoding])
+        for encoding, encode in encoders.items()
+    }
+
+
+def negotiate_encoding(accept_encodings, available) -> str:
+    # * the client's q-values decide, ties go to preferred_encodings order
+    return accept_encodings.best_match(
+        [
+            encoding
+            for encoding in preferred_encodings
+            if encoding in available
+        ]
+    )
+
+
+class ResponseCompressor():
+    # * compression of dynamic responses: bodies under min_size are sent
+    # * as is, levels default to fast settings suited to per-request work.
+    default_levels = {
+        "gzip": 6,
+        "br": 4,
+        "zstd": 3
+    }
+
+    def __init__(
+        self,
+        min_size: int = 1024,
+        levels: dict = None,
+        encodings: list = None
+    ):
+        self.min_size = min_size
+        self.levels = {**self.default_levels, **(levels or {})}
+        self.encodings = tuple(
+            encoding
+            for encoding in preferred_encodings
+            if encoding in encoders
+            and (encodings is None or encoding in encodings)
+        )
+
+    def negotiate(self, accept_encodings, size: int) -> str:
+        if size < self.min_size:
+            return None
+        return negotiate_encoding(accept_encodings, self.encodings)
+
+    def compress(self, data: bytes, encoding: str) -> bytes:
+        return encoders[encoding](data, self.levels[encoding])
+
+    def compress_variants(self, data: bytes) -> dict:
+        if len(data) < self.min_size:
+            return {}
+        return {
+            encoding: self.compress(data, encoding)
+            for encoding in self.encodings
+        }
@@ -2,5 +2,13 @@ messages = {
     0: "Blueprints can only be extended by FlaskEaseAPI apps",
     1: "{} of type {} is not supported. Use primitive type for declaring query or path parameters. Otherwise pydantic BaseModel for declaring request body.",
     2: "Path parameters can't have default values. Check {} endpoint method.",
-    3:"Path parameters missing from {} endpoint method arguments."
+    3:"Path parameters missing from {} endpoint method arguments.",
+    4: "Docs asset {} not found in {}.",
+    5: "{} is not a valid import path, expected module:api.",
+    6: "{} is not a FlaskEaseAPI app.",
+    7: "Docs are disabled for this FlaskEaseAPI app.",
+    8: "Unknown response_validation mode {}, use full, trusted or sampled.",
+    9: "Unknown profiler engine {}, use cprofile or pyinstrument.",
+    10: "The pyinstrument profiler engine requires pyinstrument to be installed.",
+    11: "Schema {} is defined by more than one model, only the last one registered is documented."
 }
@@ -1,29 +1,68 @@
 from flask import (
     Blueprint,
     Flask,
+    Response,
+    json as flask_json,
+    make_response,
+    render_template_string,
     request,
-    render_template_string
+    send_from_directory
 )
+from concurrent.futures import Executor
 from typing import (
     List
 )
 from flask_ease.schemas import ResponseModel
+from pydantic import BaseModel
 from pydantic.main import ModelMetaclass
 from flask_ease.utils import (
+    SchemaRegistry,
     get_operation_id,
     parse_response_model,
     extract_params,
     extract_dependencies,
+    DependencyPlan,
     generate_openapi_paths,
     generate_auth_scheme,
     HTTPException,
-    check_file_validity,
-    extract_files_from_request
+    compile_body_binder,
+    compile_param_binder,
+    compile_response_validator,
+    make_spooling_request_class,
+    run_async
 )
-from flask_ease.templates.swagger_ui import html as swagger_html
-from flask_ease.templates.redoc_ui import html as redoc_html
+from flask_ease.caching import (
+    CachedResponse,
+    ResponseCache
+)
+from flask_ease.compression import (
+    ResponseCompressor,
+    file_extensions
+)
+from flask_ease.responses import (
+    PrecomputedPayload,
+    flask_json_serializer,
+    generate_etag,
+    make_json_response,
+    not_modified
+)
+from flask_ease.profiling import RouteProfiler
+from flask_ease.timing import StageTimer
+from flask_ease.templates.swagger_ui import (
+    html as swagger_html,
+    assets as swagger_assets,
+    local_assets as swagger_local_assets
+)
+from flask_ease.templates.redoc_ui import (
+    html as redoc_html,
+    assets as redoc_assets,
+    local_assets as redoc_local_assets
+)
+import inspect
 import logging
 import json
+import os
+import threading
 from flask_ease.exceptions import messages
 
 
@@ -36,6 +75,18 @@ class FlaskEaseAPI():
         app_version: str = "0.1.0",
         auth_scheme=None,
         import_name=__name__,
+        docs_assets_folder: str = None,
+        lazy_docs: bool = False,
+        docs: bool = None,
+        json_serializer=None,
+        response_validation: str = None,
+        response_sample_rate: float = None,
+        dependency_executor: Executor = None,
+        upload_spool_threshold: int = None,
+        compression: ResponseCompressor = None,
+        server_timing: bool = False,
+        timing_callback=None,
+        profiler: RouteProfiler = None,
         **kwargs
     ):
         self.blueprint_name = blueprint_name
@@ -44,6 +95,11 @@ class FlaskEaseAPI():
             self.app = Blueprint(blueprint_name, import_name, **kwargs)
         else:
             self.app = Flask(import_name, **kwargs)
+            if upload_spool_threshold is not None:
+                self.app.request_class = make_spooling_request_class(
+                    self.app.request_class,
+                    upload_spool_threshold
+                )
 
         self.app_version = app_version
         self.title = title
@@ -51,14 +107,37 @@ class FlaskEaseAPI():
         self.open_api = {
             "openapi": open_api_version
         }
-        self.components = {}
-        self.definitions = {}
+        self.components = SchemaRegistry()
+        self.definitions = SchemaRegistry()
         self.auth_scheme = auth_scheme
+        self.open_api_payload = None
+        self.docs_assets_folder = docs_assets_folder
+        if docs is None:
+            docs = os.environ.get("FLASK_EASE_DOCS", "1").lower() not in (
+                "0", "false", "no", "off"
+            )
+        self.docs = docs
+        self.json_serializer = json_serializer
+        self.response_validation = response_validation
+        self.response_sample_rate = response_sample_rate
+        self.dependency_executor = dependency_executor
+        self.compression = compression
+        self.server_timing = server_timing
+        self.timing_callback = timing_callback
+        self.profiler = profiler
+        self.lazy_docs = lazy_docs
+        self._pending_docs = []
+        self._docs_lock = threading.Lock()
+
+    def build_open_api(self):
+        if self.open_api_payload is not None:
+            return self.open_api
+
+        # * routes registered lazily are documented now, on first use
+        for pending in self._pending_docs:
+            self._document(*pending)
+        self._pending_docs = []
 
-    def generate(self):
-        if self.blueprint_name:
-            logging.error(messages[0])
-            return
         self.open_api = {
             **self.open_api,
             "info": {
@@ -75,23 +154,245 @@ class FlaskEaseAPI():
             self.open_api["components"]["securitySchemes"] = \
                 generate_auth_scheme(self.auth_scheme)
 
+        self.open_api_payload = PrecomputedPayload(
+            json.dumps(
+                self.open_api,
+                cls=flask_json.JSONEncoder,
+                separators=(",", ":")
+            ).encode("utf-8"),
+            "application/json"
+        )
+        return self.open_api
+
+    def load_open_api(self, path: str):
+        # * a spec exported by `flask-ease export-openapi`, served as is,
+        # * along with the .gz/.br/.zst files written next to it.
+        with open(path, "rb") as spec_file:
+            body = spec_file.read()
+        precompressed = {}
+        for encoding, extension in file_extensions.items():
+            if os.path.isfile(path + extension):
+                with open(path + extension, "rb") as spec_file:
+                    precompressed[encoding] = spec_file.read()
+
+        self._drop_docs()
+        self.open_api_payload = PrecomputedPayload(
+            body,
+            "application/json",
+            precompressed=precompressed
+        )
+
+    def generate(self, open_api_path: str = None):
+        if self.blueprint_name:
+            logging.error(messages[0])
+            return
+        if self.profiler is not None and self.profiler.token is not None:
+            self._add_profiles()
+        if not self.docs:
+            self._drop_docs()
+            return
+        if open_api_path:
+            self.load_open_api(open_api_path)
+        elif not self.lazy_docs:
+            self.build_open_api()
+
         @self.app.route("/docs/openapi.json", methods=['GET'])
         def get_openapi():
-            return self.open_api
+            if self.open_api_payload is None:
+                with self._docs_lock:
+                    self.build_open_api()
+            return self.open_api_payload.make_response()
+
+        asset_urls = self._docs_asset_urls()
+        with self.app.app_context():
+            swagger_ui_payload = PrecomputedPayload(
+                render_template_string(
+                    swagger_html,
+                    title=self.title,
+                    **asset_urls
+                ).encode("utf-8"),
+                "text/html"
+            )
+            redoc_ui_payload = PrecomputedPayload(
+                render_template_string(
+                    redoc_html,
+                    title=self.title,
+                    **asset_urls
+                ).encode("utf-8"),
+                "text/html"
+            )
 
         @self.app.route("/docs", methods=["GET"])
         def get_swagger_ui():
-            return render_template_string(
-                swagger_html,
-                title=self.title
-            )
+            return swagger_ui_payload.make_response()
 
         @self.app.route("/redoc", methods=["GET"])
         def get_redoc_ui():
-            return render_template_string(
-                redoc_html,
-                title=self.title
+            return redoc_ui_payload.make_response()
+
+        if self.docs_assets_folder:
+            @self.app.route("/docs/static/<path:filename>", methods=["GET"])
+            def get_docs_asset(filename):
+                response = send_from_directory(
+                    self.docs_assets_folder,
+                    filename
+                )
+                response.headers["Cache-Control"] = \
+                    "public, max-age=31536000, immutable"
+                return response
+
+    def _add_profiles(self):
+        profiler = self.profiler
+
+        @self.app.route("/docs/profiles", methods=["GET"])
+        def list_profiles():
+            if not profiler.is_allowed():
+                return {"detail": "Not allowed."}, 403
+            return {
+                "profiles": [
+                    {"id": index, "route": route, "samples": samples}
+                    for index, (route, samples) in enumerate(
+                        profiler.routes()
+                    )
+                ]
+            }
+
+        @self.app.route("/docs/profiles/<int:index>", methods=["GET"])
+        def download_profile(index):
+            if not profiler.is_allowed():
+                return {"detail": "Not allowed."}, 403
+            routes = profiler.routes()
+            if index >= len(routes):
+                return {"detail": "Profile not found."}, 404
+            data, mimetype = profiler.export(
+                routes[index][0],
+                request.args.get("format")
             )
+            response = Response(data, mimetype=mimetype)
+            if mimetype == "application/octet-stream":
+                response.headers["Content-Disposition"] = \
+                    f"attachment; filename=profile-{index}.prof"
+            return response
+
+    def _drop_docs(self):
+        # * only the compiled validators, held by the view functions, stay
+        self.endpoints = {}
+        self.components = SchemaRegistry()
+        self.definitions = SchemaRegistry()
+        self._pending_docs = []
+
+    def _docs_asset_urls(self):
+        if not self.docs_assets_folder:
+            return {**swagger_assets, **redoc_assets}
+
+        # * asset urls carry a content hash, so they can be cached forever
+        asset_urls = {}
+        folder = os.path.join(self.app.root_path, self.docs_assets_folder)
+        for key, filename in {
+            **swagger_local_assets,
+            **redoc_local_assets
+        }.items():
+            if filename is None:
+                asset_urls[key] = None
+                continue
+            asset_urls[key] = f"/docs/static/{filename}"
+            path = os.path.join(folder, filename)
+            if os.path.isfile(path):
+                with open(path, "rb") as asset:
+                    asset_urls[key] += f"?v={generate_etag(asset.read())}"
+            else:
+                logging.warning(messages[4].format(filename, folder))
+        return asset_urls
+
+    def _document(
+        self,
+        route: str,
+        methods: List[str],
+        func,
+        response_model,
+        tags: List[str],
+        auth_required: bool,
+        responses: dict
+    ):
+        doc_details, _ = extract_params(route, func)
+        docs_responses, docs_definitions, _, docs_components = \
+            parse_response_model(response_model, responses)
+        self._add_docs(
+            route,
+            methods,
+            func,
+            tags,
+            auth_required,
+            doc_details,
+            docs_responses,
+            docs_definitions,
+            docs_components
+        )
+
+    def _add_docs(
+        self,
+        route: str,
+        methods: List[str],
+        func,
+        tags: List[str],
+        auth_required: bool,
+        doc_details: dict,
+        docs_responses: dict,
+        docs_definitions: dict,
+        docs_components: dict = {}
+    ):
+        filtered_req_body = {
+            k: v
+            for k, v in doc_details["request_body"]["content"].items()
+            if v
+        }
+        endpoint_doc_details = {
+            "description": func.__doc__.strip() if func.__doc__ else "",
+            "parameters": doc_details["params"],
+            "tags": tags,
+            "requestBody": {
+                "content": filtered_req_body
+            },
+            "endpoint_method": func.__name__,
+            "responses": docs_responses,
+            "auth_required": auth_required
+        }
+
+        self.endpoints.setdefault(route, {})[
+            methods[0].lower()
+        ] = endpoint_doc_details
+
+        if (
+            "components" in doc_details.keys() and
+            "schemas" in doc_details["components"].keys()
+        ):
+            self.components.merge(doc_details["components"]["schemas"])
+        self.components.merge(docs_components)
+
+        self.definitions.merge(docs_definitions)
+        self.definitions.merge(doc_details["definitions"])
+
+    def _report_timing(self, route: str, timer: StageTimer, rv):
+        # * response covers validation, serialization and compression; for
+        # * streams only the start of the body is included.
+        timer.mark("response")
+        if self.timing_callback is not None:
+            for stage, seconds in timer.durations.items():
+                self.timing_callback(route, stage, seconds)
+        if not self.server_timing:
+            return rv
+        response = make_response(rv)
+        response.headers["Server-Timing"] = timer.server_timing()
+        return response
+
+    def _response_settings(self, response_validation: str = None):
+        # * looked up per request, so blueprints follow what extend() sets
+        return (
+            response_validation or self.response_validation or "full",
+            0.1 if self.response_sample_rate is None
+            else self.response_sample_rate,
+            self.json_serializer or flask_json_serializer
+        )
 
     def _register(
         self,
@@ -100,173 +401,185 @@ class FlaskEaseAPI():
         response_model=None,
         tags: List[str] = [],
         auth_required: bool = False,
-        responses: dict = {}
+        responses: dict = {},
+        response_validation: str = None,
+        cache: ResponseCache = None,
+        etag=False
     ):
         def decorate_func(func):
             adjusted_route = route
             if self.blueprint_name and self.app.url_prefix:
                 adjusted_route = self.app.url_prefix+route
 
-            doc_details, validations = extract_params(adjusted_route, func)
+            eager_docs = self.docs and not self.lazy_docs
+            doc_details, validations = extract_params(
+                adjusted_route,
+                func,
+                docs=eager_docs
+            )
 
-            docs_responses, docs_definitions, response_validations = \
-                parse_response_model(response_model, responses)
+            docs_responses, docs_definitions, response_validations, \
+                docs_components = parse_response_model(
+                    response_model,
+                    responses,
+                    docs=eager_docs
+                )
 
-            dependencies = extract_dependencies(func)
+            dependencies = DependencyPlan(extract_dependencies(func))
+            compiled_validators = {}
 
-            filtered_req_body = {
-                k: v
-                for k, v in doc_details["request_body"]["content"].items()
-                if v
-            }
-            endpoint_doc_details = {
-                "description": func.__doc__.strip() if func.__doc__ else "",
-                "parameters": doc_details["params"],
-                "tags": tags,
-                "requestBody": {
-                    "content": filtered_req_body
-                },
-                "endpoint_method": func.__name__,
-                "responses": docs_responses,
-                "auth_required": auth_required
-            }
-
-            if adjusted_route in self.endpoints.keys():
-                self.endpoints[adjusted_route][
-                    methods[0].lower()
-                ] = endpoint_doc_details
-            else:
-                self.endpoints[adjusted_route] = {
-                    f"{methods[0].lower()}": endpoint_doc_details
+            def compile_response_validators(settings):
+                validators = {
+                    status_code: compile_response_validator(model, *settings)
+                    for status_code, model in response_validations.items()
                 }
+                compiled_validators[settings] = validators
+                return validators
 
-            if (
-                "components" in doc_details.keys() and
-                "schemas" in doc_details["components"].keys()
-            ):
-                self.components = {
-                    **self.components,
-                    **doc_details["components"]["schemas"]
-                }
+            # * compiled up front too, so a bad mode fails at registration
+            compile_response_validators(
+                self._response_settings(response_validation)
+            )
 
-            self.definitions = {
-                **self.definitions,
-                **docs_definitions,
-                **doc_details["definitions"]
-            }
+            if self.docs and self.lazy_docs:
+                self._pending_docs.append((
+                    adjusted_route,
+                    methods,
+                    func,
+                    response_model,
+                    tags,
+                    auth_required,
+                    responses
+                ))
+            elif eager_docs:
+                self._add_docs(
+                    adjusted_route,
+                    methods,
+                    func,
+                    tags,
+                    auth_required,
+                    doc_details,
+                    docs_responses,
+                    docs_definitions,
+                    docs_components
+                )
+
+            param_binder = compile_param_binder(validations)
+            body_binder = compile_body_binder(validations)
+            is_async = (
+                inspect.iscoroutinefunction(func) or dependencies.is_async
+            )
 
-            def provide_request(*args, **kwargs):
-                kwargs_to_pass = kwargs
-                parameter_keys = validations["params"].keys()
-
-                request_body_key = None
-                request_form_key = None
-                if validations["request_body"]:
-                    request_body_key = list(
-                        validations["request_body"].keys())[0]
-                if validations["request_form"]:
-                    request_form_key = list(
-                        validations["request_form"].keys())[0]
+            # * etag may be a callable returning a version key for the
+            # * resource, computed from the bound params it asks for.
+            version_key = etag if callable(etag) else None
+            version_params = ()
+            if version_key is not None:
+                version_params = tuple(
+                    inspect.signature(version_key).parameters
+                )
+
+            def precheck(kwargs_to_pass, cache_key):
+                # * runs after the dependencies and before the handler,
+                # * returns (response to short-circuit with, version etag)
+                version_tag = None
+                if version_key is not None:
+                    version_tag = generate_etag(repr(version_key(**{
+                        name: kwargs_to_pass[name]
+                        for name in version_params
+                        if name in kwargs_to_pass
+                    })).encode("utf-8"))
+                    response = not_modified(version_tag)
+                    if response is not None:
+                        return response, version_tag
+                if cache_key is not None:
+                    cached = cache.get(cache_key)
+                    if cached is not None:
+                        return cached.make_response(), version_tag
+                return None, version_tag
+
+            async def call_async(kwargs_to_pass, cache_key, timer):
+                # * independent dependencies are awaited concurrently
+                kwargs_to_pass.update(await dependencies.resolve_async())
+                if timer is not None:
+                    timer.mark("dependencies")
+                early, version_tag = precheck(kwargs_to_pass, cache_key)
+                if early is not None:
+                    return early, None, version_tag
+                resp = func(**kwargs_to_pass)
+                if inspect.isawaitable(resp):
+                    resp = await resp
+                if timer is not None:
+                    timer.mark("handler")
+                return None, resp, version_tag
+
+            route_name = f"{methods[0]} {adjusted_route}"
+            checks_first = version_key is not None or cache is not None
+
+            def respond(kwargs_to_pass, timer):
+                cache_key = None
+                version_tag = None
+                settings = self._response_settings(response_validation)
+                serialize = settings[2]
+                response_validators = compiled_validators.get(settings)
+                if response_validators is None:
+                    response_validators = \
+                        compile_response_validators(settings)
                 try:
-                    for p in parameter_keys:
-                        parameter_type = validations["params"][p]["_type"]
-                        if validations["params"][p]["in"] == "path":
-                            val = request.view_args.get(p)
-                            if parameter_type != type(val):
-                                val = parameter_type(val)
-
-                            kwargs_to_pass[p] = val
-
-                        elif validations["params"][p]["in"] == "query":
-                            query_value = request.args.get(p)
-                            if query_value:
-                                kwargs_to_pass[p] = parameter_type(
-                                    query_value
-                                )
+                    for bind in param_binder:
+                        bind(kwargs_to_pass)
+                    if timer is not None:
+                        timer.mark("params")
+                    for bind in body_binder:
+                        bind(kwargs_to_pass)
+                    if timer is not None:
+                        timer.mark("body")
 
-                    if request_body_key:
-                        request_body_schema = validations[
-                            "request_body"][request_body_key]["schema"]
-
-                        if (
-                            validations["request_body"][request_body_key]["type"]
-                                == "application/json"
-                        ):
-                            kwargs_to_pass[
-                                request_body_key
-                            ] = request_body_schema(
-                                **request.json
-                            )
-                        elif(
-                            validations["request_body"][request_body_key]["type"]
-                            == "file"
-                        ):
-                            kwargs_to_pass[
-                                request_body_key
-                            ] = check_file_validity(
-                                request.data,
-                                request.mimetype,
-                                request_body_schema
+                    try:
+                        # * dependencies still run on a cache hit, so auth
+                        # * checks are never skipped; the handler is.
+                        if cache is not None:
+                            cache_key = cache.make_key(
+                                route_name,
+                                kwargs_to_pass
                             )
 
-                    if request_form_key:
-                        request_form_schema = validations[
-                            "request_form"][request_form_key]["schema"]
-                        if (
-                            "properties" in
-                            validations["request_form"][request_form_key]
-                        ):
-                            request_form_props = validations[
-                                "request_form"][request_form_key]["properties"]
-
-                        form_data = {}
-                        if (
-                            validations["request_form"][
-                                request_form_key]["type"] == "multipart/form-data"
-                        ):
-                            for k, v in request_form_props.items():
-                                if v["type"] == ('string', 'binary'):
-                                    form_data[k] = \
-                                        extract_files_from_request(
-                                        k,
-                                        request.files,
-                                        v["schema"]
-                                    )
-                                else:
-                                    if k in request.form:
-                                        form_data[k] = request.form[k]
-                                    else:
-                                        form_data[k] = None
-
-                            kwargs_to_pass[
-                                request_form_key
-                            ] = request_form_schema.schema(**form_data)
+                        early = None
+                        if is_async:
+                            early, resp, version_tag = run_async(
+                                call_async,
+                                kwargs_to_pass,
+                                cache_key,
+                                timer
+                            )
                         else:
-                            kwargs_to_pass[
-                                request_form_key
-                            ] = request_form_schema(
-                                **request.form
+                            # *resolve all the dependencies
+                            kwargs_to_pass.update(
+                                dependencies.resolve(self.dependency_executor)
                             )
+                            if timer is not None:
+                                timer.mark("dependencies")
+                            if checks_first:
+                                early, version_tag = precheck(
+                                    kwargs_to_pass,
+                                    cache_key
+                                )
+                            if early is None:
+                                resp = func(**kwargs_to_pass)
+                                if timer is not None:
+                                    timer.mark("handler")
+                        if early is not None:
+                            return early
 
-                    try:
-                        # *resolve all the dependencies
-                        for k, dep in dependencies.items():
-                            kwargs_to_pass[k] = dep()
-
-                        resp = func(**kwargs_to_pass)
                         response = resp
                         response_code = 200
                         if type(resp) == tuple:
                             response, response_code = resp
 
-                        if response_code in response_validations.keys():
-                            if type(response) is response_validations[
-                                    response_code]:
-                                response = response.dict()
-
-                            response = response_validations[response_code](
-                                **response
-                            ).dict()
+                        if response_code in response_validators:
+                            response = response_validators[response_code](
+                                response
+                            )
 
                     except Exception as e:
                         logging.exception(e)
@@ -281,7 +594,13 @@ class FlaskEaseAPI():
                             response_code = e.status_code
                 except Exception as e:
                     logging.exception(e)
-                    if type(e) == ValueError:
+                    response_code = 422
+                    if type(e) == HTTPException:
+                        response = {
+                            "detail": e.detail
+                        }
+                        response_code = e.status_code
+                    elif type(e) == ValueError:
                         response = {
                             "detail": " ".join(e.args)
                         }
@@ -289,10 +608,52 @@ class FlaskEaseAPI():
                         response = {
                             "detail": json.loads(e.json())
                         }
-                    response_code = 422
 
+                if isinstance(response, (dict, list, BaseModel)):
+                    body = serialize(response)
+                    compressor = self.compression
+                    response_etag = None
+                    if response_code == 200:
+                        response_etag = version_tag
+                        if etag and response_etag is None:
+                            response_etag = generate_etag(body)
+                        if cache_key is not None:
+                            # * every encoding is cached, hits never compress
+                            cached = CachedResponse(
+                                body,
+                                response_code,
+                                "application/json",
+                                response_etag,
+                                None if compressor is None
+                                else compressor.compress_variants(body)
+                            )
+                            cache.set(cache_key, cached)
+                            return cached.make_response()
+                    return make_json_response(
+                        body,
+                        response_code,
+                        response_etag,
+                        compressor
+                    )
                 return response, response_code
 
+            def serve(kwargs):
+                if not (self.server_timing or self.timing_callback):
+                    return respond(kwargs, None)
+                timer = StageTimer()
+                return self._report_timing(
+                    route_name,
+                    timer,
+                    respond(kwargs, timer)
+                )
+
+            def provide_request(*args, **kwargs):
+                profiler = self.profiler
+                if profiler is not None and \
+                        profiler.should_profile(route_name):
+                    return profiler.profile(route_name, serve, kwargs)
+                return serve(kwargs)
+
             provide_request.__name__ = func.__name__
             self.app.add_url_rule(
                 rule=route,
@@ -308,7 +669,10 @@ class FlaskEaseAPI():
         response_model=None,
         tags: List[str] = [],
         auth_required: bool = False,
-        responses: dict = {}
+        responses: dict = {},
+        response_validation: str = None,
+        cache: ResponseCache = None,
+        etag=False
     ):
         return self._register(
             route,
@@ -316,7 +680,10 @@ class FlaskEaseAPI():
             response_model,
             tags,
             auth_required,
-            responses
+            responses,
+            response_validation=response_validation,
+            cache=cache,
+            etag=etag
         )
 
     def post(
@@ -325,7 +692,8 @@ class FlaskEaseAPI():
         response_model=None,
         tags: List[str] = [],
         auth_required: bool = False,
-        responses: dict = {}
+        responses: dict = {},
+        response_validation: str = None
     ):
         return self._register(
             route,
@@ -333,7 +701,8 @@ class FlaskEaseAPI():
             response_model,
             tags,
             auth_required,
-            responses
+            responses,
+            response_validation=response_validation
         )
 
     def put(
@@ -342,7 +711,8 @@ class FlaskEaseAPI():
         response_model=None,
         tags: List[str] = [],
         auth_required: bool = False,
-        responses: dict = {}
+        responses: dict = {},
+        response_validation: str = None
     ):
         return self._register(
             route,
@@ -350,7 +720,8 @@ class FlaskEaseAPI():
             response_model,
             tags,
             auth_required,
-            responses
+            responses,
+            response_validation=response_validation
         )
 
     def patch(
@@ -359,7 +730,8 @@ class FlaskEaseAPI():
         response_model=None,
         tags: List[str] = [],
         auth_required: bool = False,
-        responses: dict = {}
+        responses: dict = {},
+        response_validation: str = None
     ):
         return self._register(
             route,
@@ -367,7 +739,8 @@ class FlaskEaseAPI():
             response_model,
             tags,
             auth_required,
-            responses
+            responses,
+            response_validation=response_validation
         )
 
     def delete(
@@ -376,7 +749,8 @@ class FlaskEaseAPI():
         response_model=None,
         tags: List[str] = [],
         auth_required: bool = False,
-        responses: dict = {}
+        responses: dict = {},
+        response_validation: str = None
     ):
         return self._register(
             route,
@@ -384,22 +758,35 @@ class FlaskEaseAPI():
             response_model,
             tags,
             auth_required,
-            responses
+            responses,
+            response_validation=response_validation
         )
 
     def extend(self, blueprints: list):
         for blueprint in blueprints:
             self.app.register_blueprint(
                 blueprint.app)
-            self.endpoints = {
-                **self.endpoints,
-                **blueprint.endpoints
-            }
-            self.components = {
-                **self.components,
-                **blueprint.components
-            }
-            self.definitions = {
-                **self.definitions,
-                **blueprint.definitions
-            }
+            if blueprint.dependency_executor is None:
+                blueprint.dependency_executor = self.dependency_executor
+            if blueprint.compression is None:
+                blueprint.compression = self.compression
+            if blueprint.json_serializer is None:
+                blueprint.json_serializer = self.json_serializer
+            if blueprint.response_validation is None:
+                blueprint.response_validation = self.response_validation
+            if blueprint.response_sample_rate is None:
+                blueprint.response_sample_rate = self.response_sample_rate
+            if blueprint.timing_callback is None:
+                blueprint.timing_callback = self.timing_callback
+            blueprint.server_timing = \
+                blueprint.server_timing or self.server_timing
+            if blueprint.profiler is None:
+                blueprint.profiler = self.profiler
+            if not self.docs:
+                blueprint._drop_docs()
+                continue
+            self._pending_docs.extend(blueprint._pending_docs)
+            for route, operations in blueprint.endpoints.items():
+                self.endpoints.setdefault(route, {}).update(operations)
+            self.components.merge(blueprint.components)
+            self.definitions.merge(blueprint.definitions)
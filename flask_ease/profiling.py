@@ -0,0 +1,131 @@
+import cProfile
+import collections
+import functools
+import hmac
+import io
+import itertools
+import marshal
+import pstats
+import threading
+
+from flask import request
+
+try:
+    import pyinstrument
+    from pyinstrument.renderers import HTMLRenderer
+    from pyinstrument.session import Session
+except ImportError:  # pragma: no cover - optional dependency
+    pyinstrument = None
+
+from flask_ease.exceptions import messages
+
+
+class RouteProfiler():
+    # * profiles 1-in-sample_rate requests of every route, and any request
+    # * sending header from an allowlisted caller; results are aggregated
+    # * per route and served next to the docs. Without a token only
+    # * sampling runs, the header trigger and the endpoints stay off.
+    # * pyinstrument sessions keep every sample, so only the last
+    # * max_sessions of a route are kept and combined on export.
+    def __init__(
+        self,
+        sample_rate: int = 1000,
+        header: str = "X-Flask-Ease-Profile",
+        allowed_addrs: list = ("127.0.0.1", "::1"),
+        token: str = None,
+        engine: str = "cprofile",
+        max_sessions: int = 100
+    ):
+        if engine not in ("cprofile", "pyinstrument"):
+            raise ValueError(messages[9].format(engine))
+        if engine == "pyinstrument" and pyinstrument is None:
+            raise ValueError(messages[10])
+        self.sample_rate = sample_rate
+        self.header = header
+        self.allowed_addrs = frozenset(allowed_addrs)
+        self.token = token
+        self.engine = engine
+        self.max_sessions = max_sessions
+        self.results = {}
+        self.samples = {}
+        self._counters = {}
+        self._lock = threading.Lock()
+
+    def is_allowed(self) -> bool:
+        if self.token is None:
+            return False
+        if request.remote_addr not in self.allowed_addrs:
+            return False
+        return hmac.compare_digest(
+            request.headers.get(self.header, ""),
+            self.token
+        )
+
+    def should_profile(self, route: str) -> bool:
+        if self.header in request.headers and self.is_allowed():
+            return True
+        if not self.sample_rate:
+            return False
+        counter = self._counters.get(route)
+        if counter is None:
+            counter = self._counters.setdefault(route, itertools.count(1))
+        return next(counter) % self.sample_rate == 0
+
+    def profile(self, route: str, view, kwargs):
+        if self.engine == "pyinstrument":
+            profiler = pyinstrument.Profiler()
+            profiler.start()
+            try:
+                return view(kwargs)
+            finally:
+                self._add(route, profiler.stop())
+
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # * another profiler is already active on this thread
+            return view(kwargs)
+        try:
+            return view(kwargs)
+        finally:
+            profiler.disable()
+            self._add(route, profiler)
+
+    def _add(self, route: str, result):
+        with self._lock:
+            self.samples[route] = self.samples.get(route, 0) + 1
+            aggregated = self.results.get(route)
+            if self.engine == "pyinstrument":
+                if aggregated is None:
+                    aggregated = self.results[route] = collections.deque(
+                        maxlen=self.max_sessions
+                    )
+                aggregated.append(result)
+            elif aggregated is None:
+                self.results[route] = pstats.Stats(result)
+            else:
+                aggregated.add(result)
+
+    def routes(self) -> list:
+        with self._lock:
+            return sorted(self.samples.items())
+
+    def export(self, route: str, format: str = None):
+        # * returns (data, mimetype); cProfile stats are in the binary
+        # * format read by pstats.Stats and snakeviz, or text on request.
+        if self.engine == "pyinstrument":
+            # * combined outside the lock, sampled requests don't wait on it
+            with self._lock:
+                sessions = list(self.results[route])
+            session = functools.reduce(Session.combine, sessions)
+            return HTMLRenderer().render(session), "text/html"
+        with self._lock:
+            result = self.results[route]
+            if format == "text":
+                output = io.StringIO()
+                stats = pstats.Stats(stream=output)
+                stats.add(result)
+                stats.sort_stats("cumulative").print_stats()
+                return output.getvalue(), "text/plain"
+            return marshal.dumps(result.stats), "application/octet-stream"
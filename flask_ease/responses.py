@@ -0,0 +1,247 @@
+import hashlib
+import itertools
+
+import logging
+
+from flask import (
+    Response,
+    json as flask_json,
+    request,
+    stream_with_context
+)
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+from flask_ease.compression import (
+    ResponseCompressor,
+    encoders,
+    negotiate_encoding,
+    precompress_levels
+)
+
+
+# * serializers get the dicts and lists views return, or the validated
+# * instances of their response model, and return the encoded bytes.
+def flask_json_serializer(data) -> bytes:
+    # * same encoder and app settings as jsonify
+    if isinstance(data, BaseModel):
+        data = data.dict()
+    return flask_json.dumps(data).encode("utf-8")
+
+
+def _dump_model(obj):
+    if isinstance(obj, BaseModel):
+        return obj.dict()
+    raise TypeError
+
+
+def orjson_serializer(data) -> bytes:
+    return orjson.dumps(data, default=_dump_model)
+
+
+def model_json_serializer(data) -> bytes:
+    # * models go through their own .json(), so Config.json_dumps and
+    # * json_encoders (an orjson json_dumps for one) apply end to end
+    if isinstance(data, BaseModel):
+        return data.json().encode("utf-8")
+    return flask_json_serializer(data)
+
+
+def not_modified(etag: str, weak: bool = False) -> Response:
+    # * a bodiless 304 when the client already holds this version
+    if request.if_none_match.contains_weak(etag):
+        response = Response(status=304)
+        response.set_etag(etag, weak=weak)
+        return response
+    return None
+
+
+def make_body_response(
+    body: bytes,
+    status_code: int,
+    mimetype: str,
+    etag: str = None,
+    compressor: ResponseCompressor = None,
+    variants: dict = None
+) -> Response:
+    # * variants holds already encoded bodies, otherwise compressor encodes
+    # * the negotiated one; either way the response varies on encoding.
+    encoding = None
+    if variants:
+        encoding = negotiate_encoding(request.accept_encodings, variants)
+    elif compressor is not None:
+        encoding = compressor.negotiate(request.accept_encodings, len(body))
+
+    response = None
+    if etag is not None:
+        # * encoded bodies are not byte-identical, so their tag is weak
+        response = not_modified(etag, weak=encoding is not None)
+    if response is None:
+        if encoding is None:
+            data = body
+        elif variants:
+            data = variants[encoding]
+        else:
+            data = compressor.compress(body, encoding)
+        response = Response(data, status=status_code, mimetype=mimetype)
+        if encoding is not None:
+            response.headers["Content-Encoding"] = encoding
+        if etag is not None:
+            response.set_etag(etag, weak=encoding is not None)
+    if compressor is not None or variants is not None:
+        response.vary.add("Accept-Encoding")
+    return response
+
+
+def make_json_response(
+    body: bytes,
+    status_code: int,
+    etag: str = None,
+    compressor: ResponseCompressor = None
+) -> Response:
+    if etag is None and compressor is None:
+        return Response(body, status=status_code, mimetype="application/json")
+    return make_body_response(
+        body,
+        status_code,
+        "application/json",
+        etag,
+        compressor
+    )
+
+
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def _encode_items(items, validate_item, serialize):
+    for item in items:
+        body = serialize(validate_item(item))
+        yield body.encode("utf-8") if isinstance(body, str) else body
+
+
+def _ndjson_chunks(bodies):
+    for body in bodies:
+        yield body + b"\n"
+
+
+def _json_array_chunks(bodies):
+    separator = b"["
+    for body in bodies:
+        yield separator + body
+        separator = b","
+    yield b"]" if separator == b"," else b"[]"
+
+
+def _buffer_chunks(chunks, chunk_size: int):
+    # * the first chunk is sent at once, the rest in chunk_size batches
+    chunks = iter(chunks)
+    for chunk in chunks:
+        yield chunk
+        break
+
+    buffer, size = [], 0
+    for chunk in chunks:
+        buffer.append(chunk)
+        size += len(chunk)
+        if size >= chunk_size:
+            yield b"".join(buffer)
+            buffer, size = [], 0
+    if buffer:
+        yield b"".join(buffer)
+
+
+def _log_stream_errors(chunks):
+    # * the status line is already sent, so a failing item is re-raised
+    # * to abort the connection; ending the body cleanly would pass a
+    # * truncated stream off as a complete one.
+    try:
+        yield from chunks
+    except Exception as e:
+        logging.exception(e)
+        raise
+
+
+def make_stream_response(
+    items,
+    validate_item,
+    serialize,
+    media_type: str,
+    status_code: int = 200,
+    chunk_size: int = STREAM_CHUNK_SIZE
+) -> Response:
+    bodies = _encode_items(items, validate_item, serialize)
+    # * the first item is pulled before the status line is sent, so errors
+    # * raised up to that point still get their own status code
+    for first in bodies:
+        bodies = itertools.chain((first,), bodies)
+        break
+    if media_type == "application/json":
+        chunks = _json_array_chunks(bodies)
+    else:
+        chunks = _ndjson_chunks(bodies)
+    return Response(
+        stream_with_context(
+            _log_stream_errors(_buffer_chunks(chunks, chunk_size))
+        ),
+        status=status_code,
+        mimetype=media_type
+    )
+
+
+def generate_etag(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()[:32]
+
+
+class PrecomputedPayload():
+    # * a response body that never changes once built: encoded and hashed
+    # * a single time, each encoding compressed on its first request, then
+    # * served as is. Building one at startup compresses nothing.
+    def __init__(
+        self,
+        body: bytes,
+        mimetype: str,
+        cache_control: str = "no-cache",
+        precompressed: dict = None
+    ):
+        self.body = body
+        self.mimetype = mimetype
+        self.cache_control = cache_control
+        self.etag = generate_etag(body)
+        precompressed = precompressed or {}
+        self.variants = {
+            encoding: (precompressed.get(encoding), f"{self.etag}-{encoding}")
+            for encoding in encoders
+        }
+        self.etags = (self.etag,) + tuple(
+            etag for _, etag in self.variants.values()
+        )
+
+    def variant(self, encoding: str) -> bytes:
+        data, etag = self.variants[encoding]
+        if data is None:
+            # * no lock: concurrent first requests may both compress, to
+            # * the same bytes, rather than queue behind each other
+            data = encoders[encoding](self.body, precompress_levels[encoding])
+            self.variants[encoding] = (data, etag)
+        return data
+
+    def make_response(self) -> Response:
+        encoding = negotiate_encoding(request.accept_encodings, self.variants)
+        etag = self.variants[encoding][1] if encoding else self.etag
+
+        if any(request.if_none_match.contains_weak(e) for e in self.etags):
+            response = Response(status=304)
+        else:
+            body = self.variant(encoding) if encoding else self.body
+            response = Response(body, mimetype=self.mimetype)
+            if encoding:
+                response.headers["Content-Encoding"] = encoding
+
+        response.set_etag(etag)
+        response.headers["Cache-Control"] = self.cache_control
+        response.headers["Vary"] = "Accept-Encoding"
+        return response
@@ -1,3 +1,7 @@
+import io
+import mmap
+import os
+import tempfile
 from pydantic import (
     BaseModel
 )
@@ -40,6 +44,55 @@ class File:
     max_length: int = None
     min_length: int = None
     _data: any = None
+    spooled: bool = False
+    # * bytes kept in memory before a spooled body rolls over to disk
+    spool_max_size: int = None
+
+    @property
+    def _stream(self):
+        return getattr(self._data, "stream", self._data)
+
+    @property
+    def path(self) -> Optional[str]:
+        # * set when the upload was spooled to a named temp file
+        name = getattr(self._stream, "name", None)
+        return name if isinstance(name, str) and os.path.isfile(name) \
+            else None
+
+    def read(self) -> bytes:
+        stream = self._stream
+        stream.seek(0)
+        return stream.read()
+
+    def as_memoryview(self) -> memoryview:
+        # * a view on the uploaded bytes without copying them: the buffer
+        # * of in-memory parts, or a read-only mmap of spooled ones.
+        stream = self._stream
+        if isinstance(stream, (bytes, bytearray)):
+            return memoryview(stream)
+        if isinstance(stream, io.BytesIO):
+            return stream.getbuffer()
+        if isinstance(stream, tempfile.SpooledTemporaryFile) and \
+                not stream._rolled:
+            # * fileno() would first roll the in-memory part over to disk
+            return stream._file.getbuffer()
+        try:
+            stream.flush()
+            fileno = stream.fileno()
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            return memoryview(self.read())
+        if os.fstat(fileno).st_size == 0:
+            return memoryview(b"")
+        return memoryview(mmap.mmap(fileno, 0, access=mmap.ACCESS_READ))
+
+
+@dataclass
+class Stream:
+    schema: ModelMetaclass
+    media_type: str = "application/x-ndjson"
+
+    def __class_getitem__(cls, schema):
+        return cls(schema=schema)
 
 
 class _OAuth2PasswordRequestFormSchema(BaseModel):
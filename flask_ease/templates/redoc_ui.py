@@ -1,3 +1,13 @@
+assets = {
+    "redoc_fonts_url": "https://fonts.googleapis.com/css?family=Montserrat:300,400,700|Roboto:300,400,700",
+    "redoc_js_url": "https://cdn.jsdelivr.net/npm/redoc@next/bundles/redoc.standalone.js"
+}
+
+local_assets = {
+    "redoc_fonts_url": None,
+    "redoc_js_url": "redoc.standalone.js"
+}
+
 html = """
     <!DOCTYPE html>
     <html>
@@ -6,11 +16,13 @@ html = """
     <!-- needed for adaptive design -->
     <meta charset="utf-8"/>
     <meta name="viewport" content="width=device-width, initial-scale=1">
-    <link href="https://fonts.googleapis.com/css?family=Montserrat:300,400,700|Roboto:300,400,700" rel="stylesheet">
+    {% if redoc_fonts_url %}
+    <link href="{{redoc_fonts_url}}" rel="stylesheet">
+    {% endif %}
     </head>
     <body>
     <redoc spec-url='/docs/openapi.json'></redoc>
-    <script src="https://cdn.jsdelivr.net/npm/redoc@next/bundles/redoc.standalone.js"> </script>
+    <script src="{{redoc_js_url}}"> </script>
     </body>
     </html>
     """
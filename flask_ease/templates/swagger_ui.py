@@ -1,3 +1,15 @@
+assets = {
+    "swagger_css_url": "https://cdn.jsdelivr.net/npm/swagger-ui-dist@3/swagger-ui.css",
+    "swagger_favicon_url": "https://cdn.jsdelivr.net/npm/swagger-ui-dist@3.26.2/favicon-16x16.png",
+    "swagger_js_url": "https://cdn.jsdelivr.net/npm/swagger-ui-dist@3/swagger-ui-bundle.js"
+}
+
+local_assets = {
+    "swagger_css_url": "swagger-ui.css",
+    "swagger_favicon_url": "favicon-16x16.png",
+    "swagger_js_url": "swagger-ui-bundle.js"
+}
+
 html = """
 <!DOCTYPE html>
 <html>
@@ -5,17 +17,17 @@ html = """
     <link
       type="text/css"
       rel="stylesheet"
-      href="https://cdn.jsdelivr.net/npm/swagger-ui-dist@3/swagger-ui.css"
+      href="{{swagger_css_url}}"
     />
     <link
       rel="shortcut icon"
-      href="https://cdn.jsdelivr.net/npm/swagger-ui-dist@3.26.2/favicon-16x16.png"
+      href="{{swagger_favicon_url}}"
     />
     <title>{{title}}</title>
   </head>
   <body>
     <div id="swagger-ui"></div>
-    <script src="https://cdn.jsdelivr.net/npm/swagger-ui-dist@3/swagger-ui-bundle.js"></script>
+    <script src="{{swagger_js_url}}"></script>
     <!-- `SwaggerUIBundle` is now available on the page -->
     <script>
       const ui = SwaggerUIBundle({
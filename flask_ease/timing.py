@@ -0,0 +1,29 @@
+import time
+
+
+class StageTimer():
+    # * durations of the consecutive stages of one request: each mark
+    # * closes the stage that started at the previous mark.
+    def __init__(self):
+        self.durations = {}
+        self._started = time.perf_counter()
+
+    def mark(self, stage: str):
+        now = time.perf_counter()
+        self.durations[stage] = self.durations.get(stage, 0.0) + \
+            now - self._started
+        self._started = now
+
+    def server_timing(self) -> str:
+        return ", ".join(
+            f"{stage};dur={seconds * 1000:.3f}"
+            for stage, seconds in self.durations.items()
+        )
+
+
+def prometheus_observer(histogram):
+    # * a timing_callback feeding a prometheus_client Histogram declared
+    # * with the labels ("route", "stage")
+    def observe(route: str, stage: str, seconds: float):
+        histogram.labels(route=route, stage=stage).observe(seconds)
+    return observe
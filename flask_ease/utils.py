@@ -1,9 +1,21 @@
 from pydantic.main import ModelMetaclass
 from dataclasses import (
-    asdict
+    asdict,
+    dataclass
 )
+import asyncio
+from concurrent.futures import (
+    Executor,
+    wait as futures_wait
+)
+from functools import lru_cache
 import inspect
+import logging
+import random
 import re
+import tempfile
+import threading
+import weakref
 from uuid import UUID
 from typing import (
     Callable,
@@ -12,13 +24,28 @@ from typing import (
 )
 from enum import Enum
 import http
+from io import BytesIO
 from flask_ease.schemas import (
     Form,
     File,
-    MultipartForm
+    MultipartForm,
+    Stream
 )
+from flask_ease.responses import make_stream_response
 from flask_ease import status
 from flask_ease.exceptions import messages
+from flask import (
+    _app_ctx_stack,
+    _request_ctx_stack,
+    after_this_request,
+    current_app,
+    has_request_context,
+    request
+)
+
+
+FILE_CHUNK_SIZE = 64 * 1024
+FILE_SPOOL_MAX_SIZE = 1024 * 1024
 
 
 class HTTPException(Exception):
@@ -44,21 +71,44 @@ def extract_dependencies(func):
     return dependencies
 
 
+DEPENDENCY_CACHE_KEY = "flask_ease.dependency_cache"
+
+
+def get_dependency_cache():
+    # * the WSGI environ lives exactly as long as the request, and is shared
+    # * with copies of the request context pushed in other threads.
+    if not has_request_context():
+        return {}
+    cache = request.environ.get(DEPENDENCY_CACHE_KEY)
+    if cache is None:
+        cache = request.environ[DEPENDENCY_CACHE_KEY] = {}
+    return cache
+
+
 class Depends():
-    def __init__(self, dependency: Callable):
+    def __init__(self, dependency: Callable, use_cache: bool = True):
         self.dependency = dependency
+        self.use_cache = use_cache
+        self._plan = None
+
+    @property
+    def cache_key(self):
+        return self.dependency
 
     def __call__(self):
-        dependencies = extract_dependencies(self.dependency)
-        kwargs_to_pass = {}
-        for k, dep in dependencies.items():
-            kwargs_to_pass[k] = dep()
-        return self.dependency(**kwargs_to_pass)
+        if self._plan is None:
+            self._plan = DependencyPlan({"dependency": self})
+        return self._plan.resolve()["dependency"]
 
 
 class Security():
-    def __init__(self, scheme):
+    def __init__(self, scheme, use_cache: bool = True):
         self.scheme = scheme
+        self.use_cache = use_cache
+
+    @property
+    def cache_key(self):
+        return self.scheme
 
     def __call__(self):
         token_header = self.scheme()
@@ -73,6 +123,169 @@ class Security():
             return token_header
 
 
+_event_loops = threading.local()
+
+
+def run_async(coroutine_function, *args):
+    # * Flask 2 runs coroutines through its own async bridge; otherwise
+    # * each worker thread keeps one event loop for all of its requests.
+    ensure_sync = getattr(current_app, "ensure_sync", None)
+    if ensure_sync is not None:
+        return ensure_sync(coroutine_function)(*args)
+
+    loop = getattr(_event_loops, "loop", None)
+    if loop is None or loop.is_closed():
+        loop = _event_loops.loop = asyncio.new_event_loop()
+    return loop.run_until_complete(coroutine_function(*args))
+
+
+class DependencyPlan():
+    # * flattens a tree of Depends/Security markers into a topologically
+    # * ordered tuple of steps, so resolving it is only direct calls.
+    # * markers with use_cache share one step and one result per request.
+    # * levels group steps whose arguments all come from earlier levels,
+    # * so the steps of one level can run concurrently.
+    def __init__(self, dependencies: dict):
+        self._steps = []
+        self._cached_slots = {}
+        self.outputs = tuple(
+            (name, self._add_step(marker))
+            for name, marker in dependencies.items()
+        )
+        self.steps = tuple(self._steps)
+        self.uses_cache = any(step[2] is not None for step in self.steps)
+        self.is_async = any(
+            inspect.iscoroutinefunction(call) for call, _, _ in self.steps
+        )
+
+        depths = []
+        for _, arguments, _ in self.steps:
+            depths.append(
+                max((depths[slot] + 1 for _, slot in arguments), default=0)
+            )
+        self.levels = tuple(
+            tuple(index for index, d in enumerate(depths) if d == depth)
+            for depth in range(max(depths, default=-1) + 1)
+        )
+        self.has_siblings = any(len(level) > 1 for level in self.levels)
+        del self._steps, self._cached_slots
+
+    def _add_step(self, marker):
+        cache_key = marker.cache_key if marker.use_cache else None
+        if cache_key is not None and cache_key in self._cached_slots:
+            return self._cached_slots[cache_key]
+
+        if isinstance(marker, Security):
+            call, arguments = marker, ()
+        else:
+            call = marker.dependency
+            arguments = tuple(
+                (name, self._add_step(sub_marker))
+                for name, sub_marker in extract_dependencies(call).items()
+            )
+        self._steps.append((call, arguments, cache_key))
+        slot = len(self._steps) - 1
+        if cache_key is not None:
+            self._cached_slots[cache_key] = slot
+        return slot
+
+    def resolve(self, executor: Executor = None):
+        if self.is_async:
+            return run_async(self.resolve_async)
+        if executor is not None and self.has_siblings:
+            return self.resolve_concurrent(executor)
+
+        cache = get_dependency_cache() if self.uses_cache else None
+        values = []
+        for call, arguments, cache_key in self.steps:
+            if cache_key is not None and cache_key in cache:
+                values.append(cache[cache_key])
+                continue
+            value = call(**{name: values[slot] for name, slot in arguments})
+            if cache_key is not None:
+                cache[cache_key] = value
+            values.append(value)
+        return {name: values[slot] for name, slot in self.outputs}
+
+    def _resolve_step(self, index, values, cache):
+        call, arguments, cache_key = self.steps[index]
+        if cache_key is not None and cache_key in cache:
+            return cache[cache_key]
+        value = call(**{name: values[slot] for name, slot in arguments})
+        if cache_key is not None:
+            cache[cache_key] = value
+        return value
+
+    def _resolve_step_in_context(self, contexts, index, values, cache):
+        # * the worker shares the request thread's own contexts, pushed
+        # * straight onto its stacks: popping them runs no teardown and
+        # * does not close the request or its uploaded files.
+        app_ctx, request_ctx = contexts
+        _app_ctx_stack.push(app_ctx)
+        _request_ctx_stack.push(request_ctx)
+        try:
+            return self._resolve_step(index, values, cache)
+        finally:
+            _request_ctx_stack.pop()
+            _app_ctx_stack.pop()
+
+    def resolve_concurrent(self, executor: Executor):
+        # * siblings of a level go to the executor within the request
+        # * context, the first one runs on the request thread.
+        cache = get_dependency_cache() if self.uses_cache else None
+        contexts = (_app_ctx_stack.top, _request_ctx_stack.top)
+        values = [None] * len(self.steps)
+        for first, *others in self.levels:
+            futures = [
+                (index, executor.submit(
+                    self._resolve_step_in_context,
+                    contexts,
+                    index,
+                    values,
+                    cache
+                ))
+                for index in others
+            ]
+            try:
+                values[first] = self._resolve_step(first, values, cache)
+            finally:
+                futures_wait([future for _, future in futures])
+            for index, future in futures:
+                values[index] = future.result()
+        return {name: values[slot] for name, slot in self.outputs}
+
+    async def _resolve_step_async(self, index, tasks, cache):
+        call, arguments, cache_key = self.steps[index]
+        if cache_key is not None and cache_key in cache:
+            return cache[cache_key]
+        kwargs_to_pass = {}
+        for name, slot in arguments:
+            kwargs_to_pass[name] = await tasks[slot]
+        value = call(**kwargs_to_pass)
+        if inspect.isawaitable(value):
+            value = await value
+        if cache_key is not None:
+            cache[cache_key] = value
+        return value
+
+    async def resolve_async(self):
+        # * one task per step, each waiting only on its own arguments, so
+        # * independent dependencies are awaited concurrently.
+        cache = get_dependency_cache() if self.uses_cache else None
+        tasks = []
+        for index in range(len(self.steps)):
+            tasks.append(asyncio.ensure_future(
+                self._resolve_step_async(index, tasks, cache)
+            ))
+        try:
+            values = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+        return {name: values[slot] for name, slot in self.outputs}
+
+
 def get_operation_id(
     path: str,
     endpoint: str,
@@ -82,43 +295,136 @@ def get_operation_id(
     return f"{endpoint}_{path}__{method}"
 
 
-def parse_response_model(model, responses):
+class SchemaRegistry(dict):
+    # * schemas by name, merged in place as routes are registered. Two
+    # * different models sharing a name can't both be documented, the last
+    # * one registered wins and the clash is logged.
+    def merge(self, schemas: dict):
+        for name, schema in schemas.items():
+            registered = self.get(name)
+            if registered is not None and registered is not schema and \
+                    registered != schema:
+                logging.warning(messages[11].format(name))
+        self.update(schemas)
+
+
+_model_schemas = weakref.WeakKeyDictionary()
+
+
+def get_model_schema(model):
+    # * process-wide memo keyed by model class: (schema, definitions), the
+    # * definitions split out of the schema. Both are shared, never mutate.
+    cached = _model_schemas.get(model)
+    if cached is None:
+        schema = dict(model.schema())
+        definitions = schema.pop("definitions", {})
+        cached = _model_schemas[model] = (schema, definitions)
+    return cached
+
+
+def parse_response_model(model, responses, docs: bool = True):
     docs_responses = {}
     docs_definitions = {}
+    docs_components = {}
     response_validations = {}
-    if type(model) == ModelMetaclass:
-        schema = model.schema()
+    if type(model) == ModelMetaclass or type(model) == Stream:
         status_code = 200
-        if "definitions" in schema.keys():
-            docs_definitions = {
-                **docs_definitions,
-                **schema["definitions"]
+        response_validations[status_code] = model
+    if not docs:
+        return (
+            docs_responses,
+            docs_definitions,
+            response_validations,
+            docs_components
+        )
+
+    if type(model) == ModelMetaclass or type(model) == Stream:
+        media_type = "application/json"
+        if type(model) == Stream:
+            component, definitions = get_model_schema(model.schema)
+            media_type = model.media_type
+        else:
+            component, definitions = get_model_schema(model)
+        docs_definitions.update(definitions)
+        title = component["title"]
+        docs_components[title] = component
+        schema = {
+            "$ref": f"#/components/schemas/{title}"
+        }
+        # * ndjson streams document a single line, json streams the array
+        if media_type == "application/json" and type(model) == Stream:
+            schema = {
+                "type": "array",
+                "items": schema
             }
-            del schema["definitions"]
-        docs_responses = {
-            **docs_responses,
-            status_code: {
-                "description": "Success",
-                "content": {
-                    "application/json": {
-                        "schema": schema
-                    }
+        docs_responses[status_code] = {
+            "description": "Success",
+            "content": {
+                media_type: {
+                    "schema": schema
                 }
             }
         }
-        response_validations = {
-            **response_validations,
-            status_code: model
-        }
     for status_code, description in responses.items():
-        docs_responses = {
-            **docs_responses,
-            status_code: {
-                "description": description,
-            }
+        docs_responses[status_code] = {
+            "description": description,
         }
 
-    return (docs_responses, docs_definitions, response_validations)
+    return (
+        docs_responses,
+        docs_definitions,
+        response_validations,
+        docs_components
+    )
+
+
+def compile_response_validator(
+    model,
+    mode: str = "full",
+    sample_rate: float = 0.1,
+    serialize: Callable = None
+):
+    # * full: every dict response is validated against the model
+    # * trusted: dict responses are passed through as returned
+    # * sampled: only about sample_rate of dict responses are validated
+    # * instances of the model were validated when built, so they are
+    # * handed to the serializer as is; subclasses only keep the model
+    # * fields.
+    # * a Stream validates and serializes each item as it is yielded.
+    if mode not in ("full", "trusted", "sampled"):
+        raise ValueError(messages[8].format(mode))
+    if type(model) == Stream:
+        validate_item = compile_response_validator(
+            model.schema,
+            mode,
+            sample_rate
+        )
+
+        def validate_stream(response):
+            return make_stream_response(
+                response,
+                validate_item,
+                serialize,
+                model.media_type
+            )
+        return validate_stream
+
+    fields = set(model.__fields__.keys())
+    trusted = mode == "trusted"
+    sampled = mode == "sampled"
+
+    def validate(response):
+        if isinstance(response, model):
+            if type(response) is model:
+                return response
+            return model.construct(
+                response.__fields_set__ & fields,
+                **{name: getattr(response, name) for name in fields}
+            )
+        if trusted or (sampled and random.random() >= sample_rate):
+            return response
+        return model(**response)
+    return validate
 
 
 def get_openapi_data_type(_type):
@@ -135,16 +441,51 @@ def get_openapi_data_type(_type):
     return "object"
 
 
+# * werkzeug rule syntax: <name>, <converter:name>, <converter(args):name>
+ROUTE_PARAM_RE = re.compile(
+    r"<(?:(?P<converter>[a-zA-Z_][a-zA-Z0-9_]*)"
+    r"(?:\((?P<arguments>.*?)\))?:)?"
+    r"(?P<name>[a-zA-Z_][a-zA-Z0-9_]*)>"
+)
+
+# * python types the built-in werkzeug converters already hand to the view
+CONVERTER_TYPES = {
+    "default": str,
+    "string": str,
+    "path": str,
+    "any": str,
+    "int": int,
+    "float": float,
+    "uuid": UUID
+}
+
+
+@dataclass(frozen=True)
+class ParsedRoute:
+    params: tuple
+    converters: dict
+    openapi_path: str
+
+
+@lru_cache(maxsize=None)
+def parse_route(route: str) -> ParsedRoute:
+    # * one pass over the rule for its path params, their converters and
+    # * the OpenAPI path template, cached per route.
+    params = []
+    converters = {}
+
+    def to_template(match):
+        name = match.group("name")
+        params.append(name)
+        converters[name] = match.group("converter") or "default"
+        return "{" + name + "}"
+
+    openapi_path = ROUTE_PARAM_RE.sub(to_template, route)
+    return ParsedRoute(tuple(params), converters, openapi_path)
+
+
 def parse_path_parameter_from_route(route):
-    path_param_found = re.search(':[\w_]+', route)
-    path_params = []
-    while path_param_found:
-        start, end = path_param_found.span()
-        param = route[start+1:end].strip()
-        route = route[end:].strip()
-        path_params.append(param)
-        path_param_found = re.search(':[\w_]+', route)
-    return path_params
+    return list(parse_route(route).params)
 
 
 def get_origins(members):
@@ -159,19 +500,17 @@ def get_origins(members):
 
 
 def extract_annotations(v, deep=False):
-    annot = dict()
     annot = v.__annotations__
     if deep:
+        annot = dict(annot)
         for b in v.__bases__:
-            annot = {
-                **annot,
-                **b.__annotations__
-            }
+            annot.update(b.__annotations__)
     return annot
 
 
-def extract_params(route, func):
-    path_params = parse_path_parameter_from_route(route)
+def extract_params(route, func, docs: bool = True):
+    parsed_route = parse_route(route)
+    path_params = parsed_route.params
     doc_details = {
         "params": [],
         "components": {},
@@ -189,6 +528,7 @@ def extract_params(route, func):
         "request_body": {},
         "request_form": {}
     }
+    request_content_types = set()
     signature = inspect.signature(func)
 
     # * inspecting out the function signature for endpoint method.
@@ -226,13 +566,12 @@ def extract_params(route, func):
                     else None
                 }
             })
-            validations["params"] = {
-                **validations["params"],
-                f"{key}": {
-                    "_type": value,
-                    "in": "path" if key not in defaults.keys()
-                    else "query"
-                }
+            validations["params"][key] = {
+                "_type": value,
+                "in": "path" if key in path_params
+                else "query",
+                "converter": parsed_route.converters.get(key),
+                "required": key not in defaults
             }
         # * if the parameter is a pydantic ModelMetaClass
         # * it's request body schema
@@ -240,74 +579,61 @@ def extract_params(route, func):
             type(value) == ModelMetaclass or
             type(value) == Form
         ):
-            if (
-                (
-                    type(value) == ModelMetaclass and
-                    doc_details["request_body"]["content"]["application/json"]
-                ) or (
-                    type(value) == Form and
-                    doc_details["request_body"]["content"][value.media_type]
-                )
-            ):
-                raise Exception(
-                    f"More that one request body found for {func.__name__} endpoint."
-                )
-            if type(value) == ModelMetaclass:
-                schema = value.schema()
-            elif type(value) == Form:
-                schema = value.schema.schema()
-
-            if "definitions" in schema.keys():
-                doc_details["definitions"] = {
-                    **doc_details["definitions"],
-                    **schema["definitions"]
-                }
-                del schema["definitions"]
-            title = schema["title"]
-            doc_details["components"]["schemas"] = {
-                f"{title}": schema
-            }
-
             content_type = "application/json"
             if type(value) == Form:
                 content_type = value.media_type
 
-            doc_details["request_body"]["content"][
-                content_type] = {
-                    "schema": {
-                        "$ref": f"#/components/schemas/{title}"
-                    }
-            }
+            if content_type in request_content_types:
+                raise Exception(
+                    f"More that one request body found for {func.__name__} endpoint."
+                )
+            request_content_types.add(content_type)
+
+            # * the schema is only needed for docs, which may be deferred
+            if docs:
+                if type(value) == ModelMetaclass:
+                    schema, definitions = get_model_schema(value)
+                elif type(value) == Form:
+                    schema, definitions = get_model_schema(value.schema)
+
+                doc_details["definitions"].update(definitions)
+                title = schema["title"]
+                doc_details["components"].setdefault(
+                    "schemas",
+                    {}
+                )[title] = schema
+
+                doc_details["request_body"]["content"][
+                    content_type] = {
+                        "schema": {
+                            "$ref": f"#/components/schemas/{title}"
+                        }
+                }
 
             if type(value) == ModelMetaclass:
-                validations["request_body"] = {
-                    f"{key}": {
-                        "type": content_type,
-                        "schema": value
-                    }
+                validations["request_body"][key] = {
+                    "type": content_type,
+                    "schema": value
                 }
             else:
-                validations["request_form"] = {
-                    f"{key}": {
-                        "type": content_type,
-                        "schema": value.schema
-                    }
+                validations["request_form"][key] = {
+                    "type": content_type,
+                    "schema": value.schema
                 }
         elif type(value) == File:
+            request_content_types.add(value.mime_type)
             doc_details["request_body"]["content"][value.mime_type] = {
                 "schema": {
                     "type": "string",
                     "format": "binary"
                 }
             }
-            validations["request_body"] = {
-                f"{key}": {
-                    "type": "file",
-                    "schema": asdict(value)
-                }
+            validations["request_body"][key] = {
+                "type": "file",
+                "schema": asdict(value)
             }
         elif type(value) == MultipartForm:
-            value_schema = value.schema.schema()
+            value_schema, value_definitions = get_model_schema(value.schema)
             schema_annotations = extract_annotations(value.schema, True)
             schema_properties = {}
             validation_properties = {}
@@ -325,7 +651,8 @@ def extract_params(route, func):
                             origins[1])
                         validation_properties[k] = {
                             "type": items_type,
-                            "schema": origins[-1]
+                            "schema": origins[-1],
+                            "array": True
                         }
                         if type(items_type) == tuple:
                             schema_properties[k] = {
@@ -356,7 +683,8 @@ def extract_params(route, func):
 
                     validation_properties[k] = {
                         "type": item_type,
-                        "schema": schema_annotations[k]
+                        "schema": schema_annotations[k],
+                        "array": False
                     }
                     if type(item_type) == tuple:
                         schema_properties[k] = {
@@ -366,9 +694,10 @@ def extract_params(route, func):
                     else:
                         if item_type == "object":
                             schema_name = v["$ref"].split("/")[-1]
-                            doc_details["components"]["schemas"] = {
-                                f"{schema_name}": value_schema["definitions"][schema_name]
-                            }
+                            doc_details["components"].setdefault(
+                                "schemas",
+                                {}
+                            )[schema_name] = value_definitions[schema_name]
 
                             schema_properties[k] = {
                                 "type": item_type,
@@ -379,6 +708,7 @@ def extract_params(route, func):
                                 "type": item_type
                             }
 
+            request_content_types.add("multipart/form-data")
             doc_details["request_body"]["content"][
                 "multipart/form-data"
             ] = {
@@ -389,12 +719,10 @@ def extract_params(route, func):
                 }
             }
 
-            validations["request_form"] = {
-                f"{key}": {
-                    "type": "multipart/form-data",
-                    "properties": validation_properties,
-                    "schema": value
-                }
+            validations["request_form"][key] = {
+                "type": "multipart/form-data",
+                "properties": validation_properties,
+                "schema": value
             }
         else:
             raise TypeError(
@@ -405,15 +733,7 @@ def extract_params(route, func):
 
 
 def convert_to_openapi_route(route):
-    path_params = parse_path_parameter_from_route(route)
-    found_count = 0
-    path_param_found = re.search('<\w+:[\w_]+>', route)
-    while path_param_found:
-        start, end = path_param_found.span()
-        route = route[:start]+"{"+path_params[found_count]+"}"+route[end:]
-        found_count += 1
-        path_param_found = re.search('<\w+:[\w_]+>', route)
-    return route
+    return parse_route(route).openapi_path
 
 
 def generate_summary(endpoint_method):
@@ -469,50 +789,187 @@ def generate_auth_scheme(scheme):
     return openapi_auth_scheme
 
 
-def check_file_validity(
-    received_file,
-    file_content_type,
-    schema
-):
-    if file_content_type != schema["mime_type"]:
+def read_file_from_request(schema):
+    # * the body is read from the input stream in chunks and counted as it
+    # * goes, so oversize uploads are rejected before being buffered.
+    if request.mimetype != schema["mime_type"]:
         raise ValueError("Invalid file type received.")
-        return None
-    if (
-        (
-            schema["min_length"]
-            and
-            len(
-                received_file) < schema["min_length"]
+
+    max_length = schema["max_length"]
+    content_length = request.content_length
+    if max_length and content_length and content_length > max_length:
+        raise HTTPException(
+            status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            "Invalid file size received."
         )
-    ):
-        raise ValueError("Invalid file size received.")
-        return None
 
-    if (
-        (
-            schema["min_length"]
-            and
-            len(
-                received_file) > schema["max_length"]
+    if schema["spooled"]:
+        received_file = tempfile.SpooledTemporaryFile(
+            max_size=schema["spool_max_size"] or FILE_SPOOL_MAX_SIZE
         )
-    ):
+        # * closed with the response, which removes a rolled over temp file
+        # * once a streamed body has been sent too
+        @after_this_request
+        def close_received_file(response):
+            response.call_on_close(received_file.close)
+            return response
+        write = received_file.write
+    else:
+        chunks = []
+        write = chunks.append
+
+    size = 0
+    stream = request.stream
+    chunk = stream.read(FILE_CHUNK_SIZE)
+    while chunk:
+        size += len(chunk)
+        if max_length and size > max_length:
+            raise HTTPException(
+                status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                "Invalid file size received."
+            )
+        write(chunk)
+        chunk = stream.read(FILE_CHUNK_SIZE)
+
+    if schema["min_length"] and size < schema["min_length"]:
         raise ValueError("Invalid file size received.")
-        return None
 
-    return received_file
+    if schema["spooled"]:
+        received_file.seek(0)
+        return received_file
+    return b"".join(chunks)
+
+
+def make_spooling_request_class(request_class, threshold: int):
+    # * multipart bodies larger than threshold have their file parts
+    # * written to named temp files, exposed through File.path and mmap.
+    class SpoolingRequest(request_class):
+        def _get_file_stream(
+            self,
+            total_content_length,
+            content_type,
+            filename=None,
+            content_length=None
+        ):
+            if total_content_length is None or \
+                    total_content_length > threshold:
+                return tempfile.NamedTemporaryFile("wb+")
+            return BytesIO()
+
+    return SpoolingRequest
+
+
+def _path_param_extractor(key, parameter_type):
+    def extract(kwargs_to_pass):
+        val = kwargs_to_pass[key]
+        if parameter_type != type(val):
+            kwargs_to_pass[key] = parameter_type(val)
+    return extract
+
+
+def _query_param_extractor(key, parameter_type, required):
+    def extract(kwargs_to_pass):
+        query_value = request.args.get(key)
+        if query_value:
+            kwargs_to_pass[key] = parameter_type(query_value)
+        elif required:
+            raise HTTPException(
+                status.HTTP_422_UNPROCESSABLE_ENTITY,
+                f"Missing required query parameter {key}."
+            )
+    return extract
 
 
-def extract_files_from_request(_key, files_dict, FileType):
-    _files = []
-    for element in files_dict.lists():
-        if element[0] == _key:
-            for _file in element[1]:
-                _files.append(
-                    FileType(
-                        mime_type=element[1][0].mimetype,
-                        _data=_file
-                    )
+def _json_body_extractor(key, schema):
+    def extract(kwargs_to_pass):
+        kwargs_to_pass[key] = schema(**request.json)
+    return extract
+
+
+def _file_body_extractor(key, schema):
+    def extract(kwargs_to_pass):
+        kwargs_to_pass[key] = read_file_from_request(schema)
+    return extract
+
+
+def _form_extractor(key, schema):
+    def extract(kwargs_to_pass):
+        kwargs_to_pass[key] = schema(**request.form)
+    return extract
+
+
+def _multipart_extractor(key, properties, multipart_form):
+    # * every field is looked up by name in the parsed form, so the cost
+    # * grows with the number of fields, not fields times parts.
+    schema = multipart_form.schema
+    fields = tuple(
+        (
+            k,
+            v["type"] == ('string', 'binary'),
+            v.get("array", False),
+            v["schema"]
+        )
+        for k, v in properties.items()
+    )
+
+    def extract(kwargs_to_pass):
+        form_data = {}
+        files = request.files
+        form = request.form
+        for k, is_file, is_array, file_type in fields:
+            if is_file:
+                # * each part keeps its own mimetype
+                values = [
+                    file_type(mime_type=part.mimetype, _data=part)
+                    for part in files.getlist(k)
+                ]
+            else:
+                values = form.getlist(k)
+                if is_array and not values:
+                    values = None
+            if is_array:
+                form_data[k] = values
+            else:
+                form_data[k] = values[0] if values else None
+        kwargs_to_pass[key] = schema(**form_data)
+    return extract
+
+
+def compile_param_binder(validations):
+    # * extractors for the path and query parameters of a route
+    extractors = []
+    for key, param in validations["params"].items():
+        if param["in"] == "path":
+            # * view args arrive already converted by werkzeug, they are
+            # * only cast when the converter yields another type
+            converter_type = CONVERTER_TYPES.get(param["converter"])
+            if converter_type is not param["_type"]:
+                extractors.append(
+                    _path_param_extractor(key, param["_type"])
                 )
-    if len(_files) == 1:
-        return _files[0]
-    return _files
+        elif param["in"] == "query":
+            extractors.append(_query_param_extractor(
+                key,
+                param["_type"],
+                param["required"]
+            ))
+    return tuple(extractors)
+
+
+def compile_body_binder(validations):
+    # * extractors for the json, file and form bodies of a route
+    extractors = []
+    for key, body in validations["request_body"].items():
+        if body["type"] == "application/json":
+            extractors.append(_json_body_extractor(key, body["schema"]))
+        elif body["type"] == "file":
+            extractors.append(_file_body_extractor(key, body["schema"]))
+
+    for key, form in validations["request_form"].items():
+        if form["type"] == "multipart/form-data":
+            extractors.append(
+                _multipart_extractor(key, form["properties"], form["schema"])
+            )
+        else:
+            extractors.append(_form_extractor(key, form["schema"]))
+    return tuple(extractors)
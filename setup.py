@@ -31,4 +31,12 @@ setup(
         "flask==1.1.2",
         "pydantic==1.5.1"
     ],
+    entry_points={
+        "console_scripts": ["flask-ease=flask_ease.cli:main"]
+    },
+    extras_require={
+        "compression": ["brotli>=1.0.9", "zstandard>=0.15.0"],
+        "orjson": ["orjson>=3.0.0"],
+        "profiling": ["pyinstrument>=4.0.0"]
+    },
 )
@@ -1,5 +1,1489 @@
-from flask_ease import __version__
+import asyncio
+import gzip
+import json
+import os
+import pstats
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from typing import List, Optional
+from uuid import UUID, uuid4
+
+import pytest
+from flask import request
+from pydantic import BaseModel, ValidationError, create_model, validator
+from werkzeug.http import parse_accept_header
+
+from flask_ease import (
+    __version__,
+    FlaskEaseAPI,
+    HTTPException,
+    Depends,
+    Security,
+    OAuth2PasswordBearer,
+    Form,
+    File,
+    MultipartForm,
+    Stream,
+    ResponseCache,
+    MemoryCacheBackend,
+    RedisCacheBackend,
+    ResponseCompressor,
+    RouteProfiler
+)
+from flask_ease.compression import (
+    encoders,
+    export_levels,
+    file_extensions,
+    negotiate_encoding,
+    precompress_levels
+)
+from flask_ease.utils import (
+    DependencyPlan,
+    SchemaRegistry,
+    compile_param_binder,
+    extract_params,
+    get_model_schema,
+    parse_route
+)
 
 
 def test_version():
     assert __version__ == '0.1.0'
+
+
+class Item(BaseModel):
+    name: str
+    price: float
+
+
+class Upload(BaseModel):
+    title: str
+    attachments: List[File]
+    note: Optional[str]
+
+
+def make_binding_api():
+    api = FlaskEaseAPI(title="Binding")
+
+    @api.get("/items/<int:item_id>")
+    def read_item(item_id: int, q: str = "none", limit: int = 10):
+        return {"item_id": item_id, "q": q, "limit": limit}
+
+    @api.post("/items")
+    def create_item(item: Item):
+        return item.dict(), 201
+
+    @api.post("/login")
+    def login(form_data: Form(schema=Item)):
+        return {"name": form_data.name}
+
+    @api.post("/uploads")
+    def upload(obj_in: MultipartForm(schema=Upload)):
+        files = obj_in.attachments
+        if not isinstance(files, list):
+            files = [files]
+        return {
+            "title": obj_in.title,
+            "files": [f._data.filename for f in files],
+            "note": obj_in.note
+        }
+
+    @api.post("/raw")
+    def raw(photo: File("image/png", max_length=8)):
+        return {"size": len(photo)}
+
+    return api
+
+
+def test_path_and_query_binding():
+    client = make_binding_api().app.test_client()
+
+    resp = client.get("/items/3?q=abc&limit=5")
+    assert resp.status_code == 200
+    assert resp.get_json() == {"item_id": 3, "q": "abc", "limit": 5}
+
+    resp = client.get("/items/3")
+    assert resp.get_json() == {"item_id": 3, "q": "none", "limit": 10}
+
+    resp = client.get("/items/3?limit=abc")
+    assert resp.status_code == 422
+
+
+def test_body_and_form_binding():
+    client = make_binding_api().app.test_client()
+
+    resp = client.post("/items", json={"name": "pen", "price": "1.5"})
+    assert resp.status_code == 201
+    assert resp.get_json() == {"name": "pen", "price": 1.5}
+
+    resp = client.post("/items", json={"name": "pen"})
+    assert resp.status_code == 422
+
+    resp = client.post("/login", data={"name": "pen", "price": "2"})
+    assert resp.get_json() == {"name": "pen"}
+
+
+def test_multipart_and_file_binding():
+    client = make_binding_api().app.test_client()
+
+    resp = client.post("/uploads", data={
+        "title": "docs",
+        "attachments": [
+            (BytesIO(b"a"), "a.txt", "text/plain"),
+            (BytesIO(b"b"), "b.txt", "text/plain")
+        ]
+    }, content_type="multipart/form-data")
+    assert resp.get_json() == {
+        "title": "docs",
+        "files": ["a.txt", "b.txt"],
+        "note": None
+    }
+
+    resp = client.post("/raw", data=b"png", content_type="image/png")
+    assert resp.get_json() == {"size": 3}
+
+    resp = client.post("/raw", data=b"png", content_type="image/jpeg")
+    assert resp.status_code == 422
+
+
+oauth2_scheme = OAuth2PasswordBearer("/login")
+
+
+def get_token_owner(token=Security(oauth2_scheme)):
+    return {"token": token}
+
+
+def get_settings():
+    return {"tenant": "acme"}
+
+
+def get_context(
+    owner=Depends(get_token_owner),
+    settings=Depends(get_settings)
+):
+    return {**owner, **settings}
+
+
+def test_dependency_plan_is_topologically_ordered():
+    plan = DependencyPlan({"context": Depends(get_context)})
+
+    calls = [call for call, _, _ in plan.steps]
+    assert calls.index(get_token_owner) < calls.index(get_context)
+    assert calls.index(get_settings) < calls.index(get_context)
+    assert isinstance(calls[0], Security)
+    assert plan.outputs == (("context", len(plan.steps) - 1),)
+
+
+def test_dependencies_resolved_per_request():
+    api = FlaskEaseAPI()
+
+    @api.get("/me")
+    def me(context=Depends(get_context)):
+        return context
+
+    client = api.app.test_client()
+    resp = client.get("/me", headers={"Authorization": "Bearer abc"})
+    assert resp.get_json() == {"token": "abc", "tenant": "acme"}
+
+    resp = client.get("/me")
+    assert resp.status_code == 401
+
+    with api.app.test_request_context(
+        headers={"Authorization": "Bearer xyz"}
+    ):
+        assert Depends(get_context)() == {"token": "xyz", "tenant": "acme"}
+
+
+def test_shared_dependencies_run_once_per_request():
+    calls = []
+
+    def get_user(token=Security(oauth2_scheme)):
+        calls.append("user")
+        return token
+
+    def get_tenant(user=Depends(get_user)):
+        return f"tenant-of-{user}"
+
+    def get_flags(user=Depends(get_user)):
+        return f"flags-of-{user}"
+
+    def get_nonce():
+        calls.append("nonce")
+        return len(calls)
+
+    api = FlaskEaseAPI()
+
+    @api.get("/context")
+    def context(
+        tenant=Depends(get_tenant),
+        flags=Depends(get_flags),
+        first=Depends(get_nonce, use_cache=False),
+        second=Depends(get_nonce, use_cache=False)
+    ):
+        return {"tenant": tenant, "flags": flags, "nonces": [first, second]}
+
+    client = api.app.test_client()
+    headers = {"Authorization": "Bearer abc"}
+    resp = client.get("/context", headers=headers)
+    assert resp.get_json() == {
+        "tenant": "tenant-of-abc",
+        "flags": "flags-of-abc",
+        "nonces": [2, 3]
+    }
+    assert calls == ["user", "nonce", "nonce"]
+
+    client.get("/context", headers=headers)
+    assert calls.count("user") == 2
+
+    with api.app.test_request_context(headers=headers):
+        assert Depends(get_tenant)() == "tenant-of-abc"
+        assert Depends(get_flags)() == "flags-of-abc"
+    assert calls.count("user") == 3
+
+
+def test_openapi_spec_is_served_precomputed():
+    api = make_binding_api()
+    api.generate()
+    client = api.app.test_client()
+
+    resp = client.get("/docs/openapi.json")
+    assert resp.status_code == 200
+    assert resp.headers["Vary"] == "Accept-Encoding"
+    spec = resp.get_json()
+    assert spec["info"]["title"] == "Binding"
+    assert "/items/{item_id}" in spec["paths"]
+    etag = resp.headers["ETag"]
+
+    resp = client.get(
+        "/docs/openapi.json",
+        headers={"Accept-Encoding": "gzip"}
+    )
+    assert resp.headers["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(resp.data)) == spec
+
+    resp = client.get(
+        "/docs/openapi.json",
+        headers={"If-None-Match": etag}
+    )
+    assert resp.status_code == 304
+    assert resp.data == b""
+
+
+def test_docs_pages_are_prerendered(tmp_path):
+    api = make_binding_api()
+    api.generate()
+    client = api.app.test_client()
+
+    resp = client.get("/docs")
+    assert resp.status_code == 200
+    assert resp.mimetype == "text/html"
+    assert b"<title>Binding</title>" in resp.data
+    assert b"cdn.jsdelivr.net/npm/swagger-ui-dist" in resp.data
+
+    resp = client.get("/redoc", headers={"If-None-Match": resp.headers["ETag"]})
+    assert resp.status_code == 200
+    resp = client.get("/redoc", headers={"If-None-Match": resp.headers["ETag"]})
+    assert resp.status_code == 304
+
+    (tmp_path / "swagger-ui-bundle.js").write_text("// bundle")
+    api = FlaskEaseAPI(title="Local", docs_assets_folder=str(tmp_path))
+    api.generate()
+    client = api.app.test_client()
+
+    resp = client.get("/docs")
+    assert b"cdn.jsdelivr.net" not in resp.data
+    assert b'src="/docs/static/swagger-ui-bundle.js?v=' in resp.data
+    assert b"fonts.googleapis.com" not in client.get("/redoc").data
+
+    resp = client.get("/docs/static/swagger-ui-bundle.js")
+    assert resp.data == b"// bundle"
+    assert "immutable" in resp.headers["Cache-Control"]
+
+
+def test_lazy_docs_are_built_on_first_spec_request():
+    api = FlaskEaseAPI(title="Lazy", lazy_docs=True)
+    pets = FlaskEaseAPI(
+        blueprint_name="Pets",
+        url_prefix="/pets",
+        lazy_docs=True
+    )
+
+    @api.post("/items", response_model=Item)
+    def create_item(item: Item):
+        return item
+
+    @pets.get("/<int:pet_id>")
+    def get_pet(pet_id: int):
+        return {"pet_id": pet_id}
+
+    api.extend([pets])
+    api.generate()
+    assert api.endpoints == {}
+    assert api.components == {}
+
+    client = api.app.test_client()
+    assert client.post("/items", json={"name": "pen", "price": 1}).get_json() \
+        == {"name": "pen", "price": 1.0}
+    assert client.get("/pets/4").get_json() == {"pet_id": 4}
+    assert api.endpoints == {}
+
+    spec = client.get("/docs/openapi.json").get_json()
+    assert set(spec["paths"]) == {"/items", "/pets/{pet_id}"}
+    assert "Item" in spec["components"]["schemas"]
+    assert client.get("/docs/openapi.json").get_json() == spec
+
+
+def test_docs_can_be_disabled(monkeypatch):
+    monkeypatch.setenv("FLASK_EASE_DOCS", "false")
+    api = FlaskEaseAPI()
+    pets = FlaskEaseAPI(blueprint_name="Pets", url_prefix="/pets", docs=True)
+
+    @api.post("/items", response_model=Item)
+    def create_item(item: Item):
+        return item
+
+    @pets.get("/<int:pet_id>")
+    def get_pet(pet_id: int):
+        return {"pet_id": pet_id}
+
+    api.extend([pets])
+    api.generate()
+    assert not api.docs
+    assert api.endpoints == pets.endpoints == {}
+    assert api.components == api.definitions == {}
+
+    client = api.app.test_client()
+    assert client.post("/items", json={"name": "pen", "price": 1}).get_json() \
+        == {"name": "pen", "price": 1.0}
+    assert client.get("/pets/4").get_json() == {"pet_id": 4}
+    for url in ("/docs", "/redoc", "/docs/openapi.json"):
+        assert client.get(url).status_code == 404
+
+
+def test_export_openapi_cli(tmp_path, monkeypatch, capsys):
+    from flask_ease.cli import main
+
+    source = (
+        "from flask_ease import FlaskEaseAPI\n"
+        "api = FlaskEaseAPI(title='Exported'{})\n"
+        "@api.get('/ping')\n"
+        "def ping():\n"
+        "    return {{'pong': True}}\n"
+    )
+    (tmp_path / "exported_app.py").write_text(source.format(""))
+    (tmp_path / "exported_nodocs.py").write_text(source.format(", docs=False"))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setenv("FLASK_EASE_DOCS", "0")
+    output = tmp_path / "openapi.json"
+
+    with pytest.raises(SystemExit):
+        main(["export-openapi", "exported_nodocs:api", "-o", str(output)])
+    assert "Docs are disabled" in capsys.readouterr().err
+
+    main(["export-openapi", "exported_app:api", "-o", str(output), "--gzip"])
+    spec = json.loads(output.read_bytes())
+    assert spec["info"]["title"] == "Exported"
+    assert b" " not in output.read_bytes()
+    assert json.loads(gzip.decompress((tmp_path / "openapi.json.gz").read_bytes())) \
+        == spec
+    # * the export is compressed at the maximum levels
+    for encoding, encode in encoders.items():
+        path = tmp_path / f"openapi.json{file_extensions[encoding]}"
+        assert path.read_bytes() == encode(
+            output.read_bytes(),
+            export_levels[encoding]
+        )
+
+    api = FlaskEaseAPI(lazy_docs=True)
+    api.generate(open_api_path=str(output))
+    resp = api.app.test_client().get(
+        "/docs/openapi.json",
+        headers={"Accept-Encoding": "gzip"}
+    )
+    assert resp.headers["Content-Encoding"] == "gzip"
+    assert resp.data == (tmp_path / "openapi.json.gz").read_bytes()
+
+
+def test_docs_are_precompressed_at_moderate_levels():
+    api = FlaskEaseAPI(title="Levels")
+
+    @api.get("/items", response_model=Item)
+    def list_items():
+        return {"name": "pen", "price": 1}
+
+    api.generate()
+    client = api.app.test_client()
+    body = client.get("/docs/openapi.json").data
+    for encoding, encode in encoders.items():
+        resp = client.get(
+            "/docs/openapi.json",
+            headers={"Accept-Encoding": encoding}
+        )
+        assert resp.headers["Content-Encoding"] == encoding
+        assert resp.data == encode(body, precompress_levels[encoding])
+
+
+def test_docs_compress_each_encoding_on_first_request(monkeypatch):
+    compressed = []
+    gzip_compress = encoders["gzip"]
+
+    def counted_gzip(data, level):
+        compressed.append(level)
+        return gzip_compress(data, level)
+    monkeypatch.setitem(encoders, "gzip", counted_gzip)
+
+    api = FlaskEaseAPI(title="Lazy compression")
+    api.generate()
+    assert compressed == []
+
+    client = api.app.test_client()
+    headers = {"Accept-Encoding": "gzip"}
+    tag = client.get("/docs/openapi.json", headers=headers).headers["ETag"]
+    assert client.get("/docs/openapi.json", headers=headers).data == \
+        gzip_compress(api.open_api_payload.body, precompress_levels["gzip"])
+    assert compressed == [precompress_levels["gzip"]]
+    headers["If-None-Match"] = tag
+    assert client.get(
+        "/docs/openapi.json",
+        headers=headers
+    ).status_code == 304
+
+
+def test_pluggable_json_serializer():
+    from flask_ease.responses import orjson_serializer
+
+    api = FlaskEaseAPI(json_serializer=orjson_serializer)
+    item_id = uuid4()
+
+    @api.get("/items/<uuid:item_id>", response_model=Item)
+    def read_item(item_id: UUID):
+        return {"name": str(item_id), "price": 2}
+
+    @api.get("/tags")
+    def read_tags():
+        return ["a", "b"]
+
+    @api.get("/text")
+    def read_text():
+        return "plain", 202
+
+    client = api.app.test_client()
+    resp = client.get(f"/items/{item_id}")
+    assert resp.mimetype == "application/json"
+    assert resp.data == b'{"name":"%s","price":2.0}' % str(item_id).encode()
+    assert client.get("/tags").get_json() == ["a", "b"]
+    assert client.get("/items/abc").status_code == 404
+
+    resp = client.get("/text")
+    assert resp.status_code == 202
+    assert resp.data == b"plain"
+
+
+def compact_dumps(value, *, default):
+    return json.dumps(value, default=default, separators=(",", ":"))
+
+
+class CompactItem(Item):
+    class Config:
+        json_dumps = compact_dumps
+
+
+def test_serializers_receive_validated_models():
+    from flask_ease.responses import model_json_serializer
+
+    received = []
+
+    def serializer(data):
+        received.append(type(data))
+        return model_json_serializer(data)
+
+    api = FlaskEaseAPI(json_serializer=serializer)
+
+    @api.get("/items", response_model=CompactItem)
+    def read_item():
+        return {"name": "pen", "price": "1"}
+
+    @api.get("/tags")
+    def read_tags():
+        return ["a", "b"]
+
+    client = api.app.test_client()
+    # * no intermediate dict, the model's own json_dumps encodes it
+    assert client.get("/items").data == b'{"name":"pen","price":1.0}'
+    assert client.get("/tags").get_json() == ["a", "b"]
+    assert received == [CompactItem, list]
+
+
+validated_items = []
+
+
+class CountedItem(Item):
+    @validator("name")
+    def count_validation(cls, v):
+        validated_items.append(v)
+        return v
+
+
+class PricedItem(CountedItem):
+    cost: float
+
+
+def test_response_models_are_not_validated_twice():
+    api = FlaskEaseAPI()
+    validated = validated_items
+    validated.clear()
+
+    @api.get("/instance", response_model=CountedItem)
+    def instance():
+        return CountedItem(name="pen", price=1)
+
+    @api.get("/subclass", response_model=CountedItem)
+    def subclass():
+        return PricedItem(name="pen", price=1, cost=0.5)
+
+    @api.get("/dict", response_model=CountedItem)
+    def as_dict():
+        return {"name": "pen", "price": "1", "cost": 0.5}
+
+    @api.get("/trusted", response_model=CountedItem, response_validation="trusted")
+    def trusted():
+        return {"name": "pen", "price": "1"}
+
+    client = api.app.test_client()
+    assert client.get("/instance").get_json() == {"name": "pen", "price": 1.0}
+    assert len(validated) == 1
+    assert client.get("/subclass").get_json() == {"name": "pen", "price": 1.0}
+    assert client.get("/dict").get_json() == {"name": "pen", "price": 1.0}
+    assert len(validated) == 3
+    assert client.get("/trusted").get_json() == {"name": "pen", "price": "1"}
+    assert len(validated) == 3
+
+    def bad():
+        return {}
+
+    with pytest.raises(ValueError):
+        api.get("/bad", response_model=CountedItem, response_validation="some")(
+            bad
+        )
+
+
+def test_sampled_response_validation(monkeypatch):
+    from flask_ease import utils
+
+    api = FlaskEaseAPI(
+        response_validation="sampled",
+        response_sample_rate=0.25
+    )
+
+    @api.get("/sampled", response_model=Item)
+    def sampled():
+        return {"name": "pen", "price": "1"}
+
+    client = api.app.test_client()
+    monkeypatch.setattr(utils.random, "random", lambda: 0.5)
+    assert client.get("/sampled").get_json() == {"name": "pen", "price": "1"}
+    monkeypatch.setattr(utils.random, "random", lambda: 0.1)
+    assert client.get("/sampled").get_json() == {"name": "pen", "price": 1.0}
+
+
+def test_blueprints_inherit_response_settings():
+    from flask_ease.responses import orjson_serializer
+
+    api = FlaskEaseAPI(
+        json_serializer=orjson_serializer,
+        response_validation="trusted"
+    )
+    blueprint = FlaskEaseAPI(blueprint_name="items", url_prefix="/items")
+    strict = FlaskEaseAPI(
+        blueprint_name="strict",
+        url_prefix="/strict",
+        response_validation="full"
+    )
+
+    @blueprint.get("/", response_model=Item)
+    def read_item():
+        return {"name": "pen", "price": "1"}
+
+    @strict.get("/", response_model=Item)
+    def read_strict_item():
+        return {"name": "pen", "price": "1"}
+
+    # * registered before extend, the settings are resolved per request
+    api.extend([blueprint, strict])
+    client = api.app.test_client()
+    assert client.get("/items/").data == b'{"name":"pen","price":"1"}'
+    assert client.get("/strict/").data == b'{"name":"pen","price":1.0}'
+
+
+def test_async_views_and_dependencies():
+    arrived = []
+    overlap = {}
+
+    async def meet():
+        # * only returns once both siblings are running at the same time
+        event = overlap.setdefault("event", asyncio.Event())
+        arrived.append(1)
+        if len(arrived) == 2:
+            event.set()
+        await asyncio.wait_for(event.wait(), timeout=5)
+
+    async def get_user(token=Security(oauth2_scheme)):
+        await meet()
+        return token
+
+    async def get_tenant():
+        await meet()
+        return "acme"
+
+    def get_flags(user=Depends(get_user)):
+        return [user]
+
+    api = FlaskEaseAPI()
+
+    @api.get("/context/<int:page>", response_model=Item)
+    async def context(
+        page: int,
+        user=Depends(get_user),
+        tenant=Depends(get_tenant),
+        flags=Depends(get_flags)
+    ):
+        await asyncio.sleep(0)
+        return {"name": f"{user}-{tenant}-{flags[0]}", "price": page}
+
+    @api.get("/sync")
+    def sync(tenant=Depends(get_tenant)):
+        return {"tenant": tenant}
+
+    client = api.app.test_client()
+    resp = client.get("/context/2", headers={"Authorization": "Bearer abc"})
+    assert resp.get_json() == {"name": "abc-acme-abc", "price": 2.0}
+    assert client.get("/context/2").status_code == 401
+    assert client.get("/sync").get_json() == {"tenant": "acme"}
+
+
+def test_sibling_dependencies_run_in_executor():
+    from flask import request
+
+    threads = set()
+    # * tenant and flags share a level, the barrier only lets them through
+    # * when both run at the same time
+    overlap = threading.Barrier(2, timeout=5)
+
+    def get_user(token=Security(oauth2_scheme)):
+        threads.add(threading.get_ident())
+        return token
+
+    def get_tenant():
+        overlap.wait()
+        threads.add(threading.get_ident())
+        return request.headers["X-Tenant"]
+
+    def get_flags():
+        overlap.wait()
+        threads.add(threading.get_ident())
+        return request.args.get("flag")
+
+    plan = DependencyPlan({
+        "user": Depends(get_user),
+        "tenant": Depends(get_tenant),
+        "flags": Depends(get_flags)
+    })
+    assert plan.has_siblings
+    assert len(plan.levels) == 2
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        api = FlaskEaseAPI(dependency_executor=executor)
+
+        @api.get("/context")
+        def context(
+            user=Depends(get_user),
+            tenant=Depends(get_tenant),
+            flags=Depends(get_flags)
+        ):
+            return {"user": user, "tenant": tenant, "flags": flags}
+
+        client = api.app.test_client()
+        resp = client.get("/context?flag=beta", headers={
+            "Authorization": "Bearer abc",
+            "X-Tenant": "acme"
+        })
+        assert resp.get_json() == {"user": "abc", "tenant": "acme", "flags": "beta"}
+        assert len(threads) == 3
+
+        resp = client.get("/context", headers={"X-Tenant": "acme"})
+        assert resp.status_code == 401
+
+
+def test_executor_dependencies_keep_uploads_open():
+    teardowns = []
+
+    def get_title():
+        time.sleep(0.05)
+        return request.form["title"]
+
+    def get_names():
+        time.sleep(0.05)
+        return [f.filename for f in request.files.getlist("attachments")]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        api = FlaskEaseAPI(dependency_executor=executor)
+        api.app.teardown_request(lambda exc: teardowns.append(exc))
+
+        @api.post("/uploads")
+        def upload(
+            obj_in: MultipartForm(schema=Upload),
+            title=Depends(get_title),
+            names=Depends(get_names)
+        ):
+            return {
+                "title": title,
+                "names": names,
+                "contents": [
+                    attachment.read().decode()
+                    for attachment in obj_in.attachments
+                ]
+            }
+
+        client = api.app.test_client()
+        resp = client.post(
+            "/uploads",
+            data={
+                "title": "docs",
+                "attachments": [
+                    (BytesIO(b"abc"), "a.txt", "text/plain"),
+                    (BytesIO(b"de"), "b.txt", "text/plain")
+                ]
+            },
+            content_type="multipart/form-data"
+        )
+        assert resp.get_json() == {
+            "title": "docs",
+            "names": ["a.txt", "b.txt"],
+            "contents": ["abc", "de"]
+        }
+        assert teardowns == [None]
+
+
+def test_streamed_list_responses():
+    api = FlaskEaseAPI()
+    produced = []
+
+    def rows(count):
+        for index in range(count):
+            produced.append(index)
+            yield {"name": f"item-{index}", "price": str(index)}
+
+    @api.get("/items.ndjson", response_model=Stream[Item])
+    def export_ndjson(count: int = 3):
+        return rows(count)
+
+    @api.get(
+        "/items.json",
+        response_model=Stream(schema=Item, media_type="application/json")
+    )
+    def export_json(count: int = 3):
+        yield from rows(count)
+        yield Item(name="last", price=9)
+
+    @api.get("/broken.json", response_model=Stream[Item])
+    def broken():
+        yield {"name": "ok", "price": 1}
+        yield {"name": "missing price"}
+
+    @api.get(
+        "/missing.json",
+        response_model=Stream(schema=Item, media_type="application/json")
+    )
+    def missing():
+        raise HTTPException(404, "No items.")
+        yield
+
+    @api.get(
+        "/invalid.json",
+        response_model=Stream(schema=Item, media_type="application/json")
+    )
+    def invalid():
+        yield {"name": "missing price"}
+
+    api.generate()
+    client = api.app.test_client()
+
+    resp = client.get("/items.ndjson", buffered=False)
+    assert resp.mimetype == "application/x-ndjson"
+    assert produced == [0]
+    lines = b"".join(resp.response).splitlines()
+    assert [json.loads(line) for line in lines] == [
+        {"name": f"item-{index}", "price": float(index)} for index in range(3)
+    ]
+
+    assert client.get("/items.json?count=0").get_json() == [
+        {"name": "last", "price": 9.0}
+    ]
+    assert len(client.get("/items.json?count=2000").get_json()) == 2001
+    # * failures after the first item abort the stream
+    resp = client.get("/broken.json", buffered=False)
+    assert resp.status_code == 200
+    chunks = iter(resp.response)
+    assert next(chunks) == b'{"name": "ok", "price": 1.0}\n'
+    with pytest.raises(ValidationError):
+        next(chunks)
+
+    # * failures up to the first item keep their status code
+    assert client.get("/missing.json").status_code == 404
+    resp = client.get("/invalid.json")
+    assert resp.status_code == 500
+    assert resp.mimetype == "application/json"
+
+    spec = client.get("/docs/openapi.json").get_json()
+    content = spec["paths"]["/items.json"]["get"]["responses"]["200"]["content"]
+    assert content["application/json"]["schema"]["type"] == "array"
+    content = spec["paths"]["/items.ndjson"]["get"]["responses"]["200"]["content"]
+    assert content["application/x-ndjson"]["schema"] == {
+        "$ref": "#/components/schemas/Item"
+    }
+    assert spec["components"]["schemas"]["Item"]["title"] == "Item"
+
+
+def test_file_uploads_are_streamed_and_limited():
+    api = FlaskEaseAPI()
+    received = []
+
+    @api.post("/photo")
+    def photo(photo: File("image/png", max_length=1024, min_length=2)):
+        received.append(photo)
+        return {"size": len(photo)}
+
+    @api.post("/spooled")
+    def spooled(photo: File("image/png", max_length=1024, spooled=True)):
+        received.append(photo)
+        return {"size": len(photo.read()), "seekable": photo.seekable()}
+
+    client = api.app.test_client()
+    assert client.post(
+        "/photo", data=b"png", content_type="image/png"
+    ).get_json() == {"size": 3}
+    assert client.post(
+        "/photo", data=b"p", content_type="image/png"
+    ).status_code == 422
+
+    resp = client.post("/photo", data=b"x" * 2048, content_type="image/png")
+    assert resp.status_code == 413
+    assert resp.get_json() == {"detail": "Invalid file size received."}
+
+    # * a chunked body has no Content-Length, only the counter stops it
+    resp = client.post("/spooled", environ_overrides={
+        "CONTENT_TYPE": "image/png",
+        "wsgi.input": BytesIO(b"x" * 4096),
+        "wsgi.input_terminated": True
+    })
+    assert resp.status_code == 413
+    assert len(received) == 1
+
+    resp = client.post("/spooled", data=b"x" * 1000, content_type="image/png")
+    assert resp.get_json() == {"size": 1000, "seekable": True}
+    assert not received[-1].closed
+    resp.close()
+    assert received[-1].closed
+
+    @api.post("/rolled")
+    def rolled(photo: File("image/png", spooled=True, spool_max_size=16)):
+        received.append(photo)
+        return {"size": len(photo.read()), "rolled": photo._rolled}
+
+    resp = client.post("/rolled", data=b"x" * 32, content_type="image/png")
+    assert resp.get_json() == {"size": 32, "rolled": True}
+    resp.close()
+    assert received[-1].closed
+
+
+def test_multipart_parts_spooled_to_disk():
+    api = FlaskEaseAPI(upload_spool_threshold=1024)
+    seen = []
+
+    @api.post("/uploads")
+    def upload(obj_in: MultipartForm(schema=Upload)):
+        for f in obj_in.attachments:
+            view = f.as_memoryview()
+            seen.append((f.path, bytes(view[:4]), len(view), f.read()[-4:]))
+            view.release()
+        return {"count": len(obj_in.attachments)}
+
+    client = api.app.test_client()
+    big = b"head" + b"x" * 4096 + b"tail"
+    resp = client.post("/uploads", data={
+        "title": "docs",
+        "attachments": [
+            (BytesIO(big), "big.bin", "application/octet-stream"),
+            (BytesIO(b"tiny"), "tiny.txt", "text/plain")
+        ]
+    }, content_type="multipart/form-data")
+    assert resp.get_json() == {"count": 2}
+    (path, head, size, tail), tiny = seen
+    assert path is not None
+    assert (head, size, tail) == (b"head", len(big), b"tail")
+    assert not os.path.exists(path)
+    assert tiny[1:] == (b"tiny", 4, b"tiny")
+
+    seen.clear()
+    resp = client.post("/uploads", data={
+        "title": "docs",
+        "attachments": [
+            (BytesIO(b"tiny"), "a.txt", "text/plain"),
+            (BytesIO(b"tiny"), "b.txt", "text/plain")
+        ]
+    }, content_type="multipart/form-data")
+    assert seen == [(None, b"tiny", 4, b"tiny")] * 2
+
+
+def test_in_memory_parts_are_viewed_without_rollover():
+    # * without upload_spool_threshold werkzeug spools every part in memory
+    api = FlaskEaseAPI()
+    seen = []
+
+    @api.post("/uploads")
+    def upload(obj_in: MultipartForm(schema=Upload)):
+        for f in obj_in.attachments:
+            view = f.as_memoryview()
+            seen.append((bytes(view), f._stream._rolled))
+            view.release()
+        return {"count": len(obj_in.attachments)}
+
+    client = api.app.test_client()
+    resp = client.post("/uploads", data={
+        "title": "docs",
+        "attachments": [(BytesIO(b"tiny"), "tiny.txt", "text/plain")]
+    }, content_type="multipart/form-data")
+    assert resp.get_json() == {"count": 1}
+    assert seen == [(b"tiny", False)]
+
+
+class Gallery(BaseModel):
+    cover: File
+    photos: List[File]
+    tags: Optional[List[str]]
+    caption: Optional[str]
+
+
+def test_multipart_fields_are_indexed_by_name():
+    api = FlaskEaseAPI()
+
+    @api.post("/gallery")
+    def gallery(obj_in: MultipartForm(schema=Gallery)):
+        return {
+            "cover": obj_in.cover.mime_type,
+            "photos": [photo.mime_type for photo in obj_in.photos],
+            "tags": obj_in.tags,
+            "caption": obj_in.caption
+        }
+
+    client = api.app.test_client()
+    resp = client.post("/gallery", data={
+        "cover": (BytesIO(b"c"), "cover.png", "image/png"),
+        "photos": [
+            (BytesIO(b"a"), "a.jpg", "image/jpeg"),
+            (BytesIO(b"b"), "b.gif", "image/gif")
+        ],
+        "tags": ["cats", "dogs"]
+    }, content_type="multipart/form-data")
+    assert resp.get_json() == {
+        "cover": "image/png",
+        "photos": ["image/jpeg", "image/gif"],
+        "tags": ["cats", "dogs"],
+        "caption": None
+    }
+
+    resp = client.post("/gallery", data={
+        "cover": (BytesIO(b"c"), "cover.png", "image/png"),
+        "photos": (BytesIO(b"a"), "a.jpg", "image/jpeg"),
+        "caption": "one"
+    }, content_type="multipart/form-data")
+    assert resp.get_json() == {
+        "cover": "image/png",
+        "photos": ["image/jpeg"],
+        "tags": None,
+        "caption": "one"
+    }
+
+    resp = client.post("/gallery", data={
+        "photos": (BytesIO(b"a"), "a.jpg", "image/jpeg")
+    }, content_type="multipart/form-data")
+    assert resp.status_code == 422
+
+
+class FakeRedis():
+    def __init__(self):
+        self.store = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def set(self, key, value, ex=None):
+        self.store[key] = value
+
+
+def test_cached_get_responses():
+    api = FlaskEaseAPI(title="Caching")
+    calls = []
+    backend = FakeRedis()
+
+    @api.get(
+        "/items/<int:item_id>",
+        cache=ResponseCache(RedisCacheBackend(backend), ttl=30)
+    )
+    def read_item(item_id: int, q: str = "none"):
+        calls.append((item_id, q))
+        return {"item_id": item_id, "q": q}
+
+    client = api.app.test_client()
+    for _ in range(3):
+        resp = client.get("/items/1?q=a")
+        assert resp.status_code == 200
+        assert resp.get_json() == {"item_id": 1, "q": "a"}
+    assert client.get("/items/1?q=b").get_json()["q"] == "b"
+    assert calls == [(1, "a"), (1, "b")]
+    assert len(backend.store) == 2
+    assert all(key.startswith("flask_ease:GET") for key in backend.store)
+
+
+def test_cache_hits_still_run_dependencies():
+    api = FlaskEaseAPI(title="Caching")
+    calls = []
+    lookups = []
+
+    def current_user():
+        user = request.headers.get("X-User")
+        lookups.append(user)
+        return user
+
+    @api.get(
+        "/me",
+        cache=ResponseCache(scope=lambda: request.headers.get("X-User"))
+    )
+    def read_me(user=Depends(current_user)):
+        calls.append(user)
+        return {"user": user}
+
+    client = api.app.test_client()
+    for user in ["a", "a", "b"]:
+        resp = client.get("/me", headers={"X-User": user})
+        assert resp.get_json() == {"user": user}
+    assert calls == ["a", "b"]
+    assert lookups == ["a", "a", "b"]
+
+
+def test_memory_cache_backend_ttl_and_lru(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    backend = MemoryCacheBackend(maxsize=2)
+    backend.set("a", 1, ttl=10)
+    backend.set("b", 2, ttl=None)
+    assert backend.get("a") == 1
+    backend.set("c", 3, ttl=None)
+    # * "b" was least recently used
+    assert backend.get("b") is None
+    assert len(backend) == 2
+    now[0] = 111.0
+    assert backend.get("a") is None
+    assert backend.get("c") == 3
+
+
+def test_etag_conditional_get():
+    api = FlaskEaseAPI(title="ETags")
+    calls = []
+    versions = {1: 3}
+
+    @api.get("/users/<int:user_id>", etag=True)
+    def read_user(user_id: int):
+        calls.append(user_id)
+        return {"id": user_id}
+
+    @api.get(
+        "/profiles/<int:user_id>",
+        etag=lambda user_id: versions[user_id]
+    )
+    def read_profile(user_id: int):
+        calls.append(-user_id)
+        return {"id": user_id, "version": versions[user_id]}
+
+    client = api.app.test_client()
+    resp = client.get("/users/1")
+    tag = resp.headers["ETag"]
+    assert resp.get_json() == {"id": 1}
+    resp = client.get("/users/1", headers={"If-None-Match": tag})
+    assert resp.status_code == 304
+    assert resp.data == b""
+    assert resp.headers["ETag"] == tag
+    assert client.get(
+        "/users/1",
+        headers={"If-None-Match": "W/" + tag}
+    ).status_code == 304
+    assert client.get("/users/2", headers={"If-None-Match": tag}).status_code \
+        == 200
+
+    # * a version key answers 304 without calling the handler
+    calls.clear()
+    tag = client.get("/profiles/1").headers["ETag"]
+    resp = client.get("/profiles/1", headers={"If-None-Match": tag})
+    assert resp.status_code == 304
+    assert calls == [-1]
+    versions[1] = 4
+    resp = client.get("/profiles/1", headers={"If-None-Match": tag})
+    assert resp.get_json() == {"id": 1, "version": 4}
+    assert resp.headers["ETag"] != tag
+
+
+def test_cached_responses_keep_their_etag():
+    api = FlaskEaseAPI(title="ETags")
+    calls = []
+
+    @api.get("/items", etag=True, cache=ResponseCache())
+    def list_items():
+        calls.append(1)
+        return [{"name": "a"}]
+
+    client = api.app.test_client()
+    tag = client.get("/items").headers["ETag"]
+    resp = client.get("/items")
+    assert resp.headers["ETag"] == tag
+    assert resp.get_json() == [{"name": "a"}]
+    assert client.get(
+        "/items",
+        headers={"If-None-Match": tag}
+    ).status_code == 304
+    assert calls == [1]
+
+
+def test_compressed_json_responses():
+    api = FlaskEaseAPI(
+        title="Compression",
+        compression=ResponseCompressor(min_size=100, encodings=["gzip"])
+    )
+
+    @api.get("/pets")
+    def list_pets(count: int = 50):
+        return [{"name": "pet", "kind": "dog"}] * count
+
+    client = api.app.test_client()
+    resp = client.get("/pets", headers={"Accept-Encoding": "gzip"})
+    assert resp.headers["Content-Encoding"] == "gzip"
+    assert resp.headers["Vary"] == "Accept-Encoding"
+    assert json.loads(gzip.decompress(resp.data))[0] == {
+        "name": "pet", "kind": "dog"
+    }
+    # * q=0 refuses an encoding, small bodies are left alone
+    resp = client.get("/pets", headers={"Accept-Encoding": "gzip;q=0"})
+    assert "Content-Encoding" not in resp.headers
+    assert len(resp.get_json()) == 50
+    resp = client.get("/pets?count=1", headers={"Accept-Encoding": "gzip"})
+    assert "Content-Encoding" not in resp.headers
+
+
+def test_negotiate_encoding_honours_q_values():
+    available = ["gzip", "br", "zstd"]
+    assert negotiate_encoding(
+        parse_accept_header("gzip, br, zstd"), available
+    ) == "br"
+    assert negotiate_encoding(
+        parse_accept_header("gzip;q=1.0, br;q=0.5"), available
+    ) == "gzip"
+    assert negotiate_encoding(
+        parse_accept_header("identity"), available
+    ) is None
+
+
+def test_cached_responses_keep_compressed_variants(monkeypatch):
+    api = FlaskEaseAPI(
+        title="Compression",
+        compression=ResponseCompressor(min_size=10, encodings=["gzip"])
+    )
+    backend = FakeRedis()
+
+    @api.get(
+        "/items",
+        etag=True,
+        cache=ResponseCache(RedisCacheBackend(backend))
+    )
+    def list_items():
+        return [{"name": "a" * 40}]
+
+    client = api.app.test_client()
+    first = client.get("/items", headers={"Accept-Encoding": "gzip"})
+    assert first.headers["Content-Encoding"] == "gzip"
+    assert first.headers["ETag"].startswith("W/")
+
+    compressed = []
+    monkeypatch.setattr(
+        ResponseCompressor,
+        "compress",
+        lambda self, data, encoding: compressed.append(encoding)
+    )
+    resp = client.get("/items", headers={"Accept-Encoding": "gzip"})
+    assert resp.data == first.data
+    assert compressed == []
+    assert client.get("/items").get_json() == [{"name": "a" * 40}]
+    assert client.get(
+        "/items",
+        headers={
+            "Accept-Encoding": "gzip",
+            "If-None-Match": first.headers["ETag"]
+        }
+    ).status_code == 304
+
+
+def test_stage_timings():
+    observed = []
+    api = FlaskEaseAPI(
+        title="Timing",
+        server_timing=True,
+        timing_callback=lambda route, stage, seconds: observed.append(
+            (route, stage, seconds)
+        )
+    )
+
+    @api.post("/items/<int:item_id>")
+    def update_item(item_id: int, item: Item, settings=Depends(get_settings)):
+        return {"item_id": item_id, **item.dict()}
+
+    client = api.app.test_client()
+    resp = client.post("/items/1", json={"name": "a", "price": 1})
+    assert resp.get_json() == {"item_id": 1, "name": "a", "price": 1}
+    stages = [stage for _, stage, _ in observed]
+    assert stages == ["params", "body", "dependencies", "handler", "response"]
+    assert {route for route, _, _ in observed} == {"POST /items/<int:item_id>"}
+    assert all(seconds >= 0 for _, _, seconds in observed)
+    timing = resp.headers["Server-Timing"].split(", ")
+    assert [entry.split(";")[0] for entry in timing] == stages
+    assert all(entry.split(";")[1].startswith("dur=") for entry in timing)
+
+
+def test_stage_timings_are_off_by_default():
+    api = make_binding_api()
+    client = api.app.test_client()
+    assert "Server-Timing" not in client.get("/items/1").headers
+
+
+def test_sampled_route_profiling(tmp_path):
+    profiler = RouteProfiler(sample_rate=3, token="secret")
+    api = FlaskEaseAPI(title="Profiling", profiler=profiler)
+
+    @api.get("/items/<int:item_id>")
+    def read_item(item_id: int):
+        return {"item_id": item_id}
+
+    api.generate()
+    client = api.app.test_client()
+    for item_id in range(6):
+        assert client.get(f"/items/{item_id}").status_code == 200
+    assert profiler.routes() == [("GET /items/<int:item_id>", 2)]
+
+    # * the debug header only counts with the right token
+    client.get("/items/1", headers={"X-Flask-Ease-Profile": "wrong"})
+    client.get("/items/1", headers={"X-Flask-Ease-Profile": "secret"})
+    assert profiler.routes() == [("GET /items/<int:item_id>", 3)]
+
+    headers = {"X-Flask-Ease-Profile": "secret"}
+    assert client.get("/docs/profiles").status_code == 403
+    assert client.get("/docs/profiles", headers=headers).get_json() == {
+        "profiles": [
+            {"id": 0, "route": "GET /items/<int:item_id>", "samples": 3}
+        ]
+    }
+    resp = client.get("/docs/profiles/0", headers=headers)
+    assert resp.mimetype == "application/octet-stream"
+    path = tmp_path / "items.prof"
+    path.write_bytes(resp.data)
+    stats = pstats.Stats(str(path))
+    assert any(name == "read_item" for _, _, name in stats.stats)
+    resp = client.get("/docs/profiles/0?format=text", headers=headers)
+    assert "read_item" in resp.get_data(as_text=True)
+    assert client.get(
+        "/docs/profiles/1",
+        headers=headers
+    ).status_code == 404
+
+
+def test_profiling_without_token_only_samples():
+    profiler = RouteProfiler(sample_rate=2)
+    api = FlaskEaseAPI(title="Profiling", profiler=profiler)
+
+    @api.get("/items")
+    def read_items():
+        return {}
+
+    api.generate()
+    client = api.app.test_client()
+    headers = {"X-Flask-Ease-Profile": ""}
+    client.get("/items", headers=headers)
+    assert profiler.routes() == []
+    client.get("/items")
+    assert profiler.routes() == [("GET /items", 1)]
+    assert client.get("/docs/profiles", headers=headers).status_code == 404
+
+
+def test_extend_merges_docs_registries_in_place():
+    api = FlaskEaseAPI(title="Registries")
+    blueprint = FlaskEaseAPI(blueprint_name="items")
+
+    @api.get("/items", response_model=Item)
+    def read_items():
+        return {"name": "a", "price": 1}
+
+    @blueprint.post("/items", response_model=Item)
+    def create_items(item: Item):
+        return item.dict()
+
+    components = api.components
+    api.extend([blueprint])
+    assert api.components is components
+    assert set(api.components) == {"Item"}
+    api.build_open_api()
+    assert set(api.open_api["paths"]["/items"]) == {"get", "post"}
+
+
+def test_schema_name_clashes_are_logged(caplog):
+    registry = SchemaRegistry()
+    schema, _ = get_model_schema(Item)
+    registry.merge({"Item": schema})
+    # * the same schema, or an equal copy of it, is not a clash
+    registry.merge({"Item": schema})
+    registry.merge({"Item": dict(schema)})
+    assert caplog.records == []
+
+    other, _ = get_model_schema(create_model("Item", name=(str, ...)))
+    registry.merge({"Item": other})
+    assert registry["Item"] is other
+    assert "Schema Item is defined by more than one model" in caplog.text
+
+
+class Owner(BaseModel):
+    name: str
+
+
+class Pet(BaseModel):
+    name: str
+    owner: Owner
+
+
+def test_model_schemas_are_memoized_and_referenced():
+    pet_schema, pet_definitions = get_model_schema(Pet)
+    assert get_model_schema(Pet) == (pet_schema, pet_definitions)
+    assert get_model_schema(Pet)[0] is pet_schema
+    assert set(pet_definitions) == {"Owner"}
+    assert "definitions" not in pet_schema
+    # * pydantic's own cached schema is left untouched
+    assert "definitions" in Pet.schema()
+
+    apis = [FlaskEaseAPI(title="Memo"), FlaskEaseAPI(title="Memo")]
+    for api in apis:
+        @api.get("/pets/<int:pet_id>", response_model=Pet)
+        def read_pet(pet_id: int):
+            return {}
+
+        @api.post("/pets", response_model=Pet)
+        def create_pet(pet: Pet):
+            return {}
+
+    for api in apis:
+        api.build_open_api()
+        spec = api.open_api
+        assert spec["components"]["schemas"]["Pet"] is pet_schema
+        assert set(spec["definitions"]) == {"Owner"}
+        for method in ("get", "post"):
+            path = "/pets" if method == "post" else "/pets/{pet_id}"
+            response = spec["paths"][path][method]["responses"][200]
+            assert response["content"]["application/json"]["schema"] == {
+                "$ref": "#/components/schemas/Pet"
+            }
+
+
+def test_routes_are_tokenized_once():
+    parsed = parse_route("/shops/<shop>/<any(cats, dogs):kind>/<int:pet_id>")
+    assert parsed.params == ("shop", "kind", "pet_id")
+    assert parsed.converters == {
+        "shop": "default",
+        "kind": "any",
+        "pet_id": "int"
+    }
+    assert parsed.openapi_path == "/shops/{shop}/{kind}/{pet_id}"
+    assert parse_route(
+        "/shops/<shop>/<any(cats, dogs):kind>/<int:pet_id>"
+    ) is parsed
+
+
+def test_path_params_without_converters():
+    api = FlaskEaseAPI(title="Routes")
+
+    @api.get("/shops/<shop>/pets/<uuid:pet_id>")
+    def read_pet(shop: str, pet_id: UUID, limit: int, size: float = 1.5):
+        return {
+            "shop": shop,
+            "pet_id": str(pet_id),
+            "limit": limit,
+            "size": size
+        }
+
+    def read_page(shop: str, page: int):
+        return {}
+    _, validations = extract_params("/shops/<shop>/<page>", read_page)
+    # * shop is a str already, only page needs casting
+    assert len(compile_param_binder(validations)) == 1
+    assert validations["params"]["page"]["in"] == "path"
+
+    pet_id = uuid4()
+    client = api.app.test_client()
+    resp = client.get(f"/shops/north/pets/{pet_id}?limit=3")
+    assert resp.get_json() == {
+        "shop": "north",
+        "pet_id": str(pet_id),
+        "limit": 3,
+        "size": 1.5
+    }
+    api.build_open_api()
+    parameters = api.open_api["paths"]["/shops/{shop}/pets/{pet_id}"]["get"][
+        "parameters"
+    ]
+    assert {p["name"]: p["in"] for p in parameters} == {
+        "shop": "path",
+        "pet_id": "path",
+        "limit": "query",
+        "size": "query"
+    }
+
+    # * limit has no default, so leaving it out is a client error
+    resp = client.get(f"/shops/north/pets/{pet_id}")
+    assert resp.status_code == 422
+    assert resp.get_json() == {
+        "detail": "Missing required query parameter limit."
+    }
+
+
+def test_pyinstrument_profiling():
+    pytest.importorskip("pyinstrument")
+    profiler = RouteProfiler(
+        sample_rate=1,
+        token="secret",
+        engine="pyinstrument",
+        max_sessions=2
+    )
+    api = FlaskEaseAPI(title="Profiling", profiler=profiler)
+
+    @api.get("/slow")
+    def slow_endpoint():
+        time.sleep(0.02)
+        return {}
+
+    api.generate()
+    client = api.app.test_client()
+    for _ in range(3):
+        client.get("/slow")
+    assert profiler.routes() == [("GET /slow", 3)]
+    # * only the last sessions are kept, combined when downloaded
+    assert len(profiler.results["GET /slow"]) == 2
+    resp = client.get(
+        "/docs/profiles/0",
+        headers={"X-Flask-Ease-Profile": "secret"}
+    )
+    assert resp.mimetype == "text/html"
+    assert "slow_endpoint" in resp.get_data(as_text=True)